@@ -2,11 +2,19 @@
 Chat endpoints for interacting with LLM agents.
 """
 
+import asyncio
+import os
+import threading
 import uuid
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from backend.api.schemas import ChatRequest, ChatResponse
+from backend.api.schemas import (
+    BatchChatRequest,
+    BatchChatResponse,
+    ChatRequest,
+    ChatResponse
+)
 from backend.core.agent import LangGraphAgent
 from backend.storage import get_storage
 from backend.config import settings
@@ -19,8 +27,42 @@ _storage = get_storage(
     database_url=settings.database_url
 )
 
-# Agent pool (keyed by model_id + thinking mode)
+# Agent pool (keyed by model_id + thinking mode). Reads are lock-free;
+# construction is guarded by a per-key lock so concurrent first requests
+# for the same model build it once while unrelated models proceed
 _agents: dict[str, LangGraphAgent] = {}
+_agents_lock = threading.Lock()
+_agent_key_locks: dict[str, threading.Lock] = {}
+
+# Streaming chunks arriving within this window (seconds) are merged
+# before being sent to the client; a full buffer flushes early so a
+# fast producer can't grow the frame (and its latency) unboundedly
+_STREAM_COALESCE_WINDOW = 0.02
+_STREAM_COALESCE_BYTES = 8192
+
+
+# Conversation ids are minted from batched entropy: one urandom read
+# serves this many ids instead of a syscall per request
+_ID_BATCH = 64
+_id_pool: list[str] = []
+
+
+def new_conversation_id() -> str:
+    """Return a fresh UUID4 string for a conversation.
+
+    Same format as str(uuid.uuid4()), but the 16 random bytes per id
+    come from a single batched os.urandom read, amortizing the syscall
+    across _ID_BATCH requests.
+    """
+    try:
+        return _id_pool.pop()
+    except IndexError:
+        entropy = os.urandom(16 * _ID_BATCH)
+        _id_pool.extend(
+            str(uuid.UUID(bytes=entropy[offset:offset + 16], version=4))
+            for offset in range(16, len(entropy), 16)
+        )
+        return str(uuid.UUID(bytes=entropy[:16], version=4))
 
 
 def get_agent(model_id: str, thinking: bool = False) -> LangGraphAgent:
@@ -34,19 +76,30 @@ def get_agent(model_id: str, thinking: bool = False) -> LangGraphAgent:
     Returns:
         LangGraphAgent instance
     """
-    global _agents, _storage
-
     # Key includes thinking mode since it affects the agent behavior
     agent_key = f"{model_id}:{thinking}"
 
-    if agent_key not in _agents:
-        _agents[agent_key] = LangGraphAgent(
-            model_id=model_id,
-            storage=_storage,
-            thinking=thinking
-        )
+    # Fast path: dict reads are atomic under the GIL, no lock needed
+    agent = _agents.get(agent_key)
+    if agent is not None:
+        return agent
+
+    # Hold the global lock only long enough to get this key's lock,
+    # then serialize construction per key so two concurrent first
+    # requests don't both pay for model/client setup
+    with _agents_lock:
+        key_lock = _agent_key_locks.setdefault(agent_key, threading.Lock())
+    with key_lock:
+        agent = _agents.get(agent_key)
+        if agent is None:
+            agent = LangGraphAgent(
+                model_id=model_id,
+                storage=_storage,
+                thinking=thinking
+            )
+            _agents[agent_key] = agent
 
-    return _agents[agent_key]
+    return agent
 
 
 @router.post("/", response_model=ChatResponse)
@@ -67,18 +120,63 @@ async def chat(request: ChatRequest):
         model_id = request.model or settings.default_model
         thinking = request.thinking if request.thinking is not None else False
         agent = get_agent(model_id, thinking)
-        conversation_id = request.conversation_id or str(uuid.uuid4())
+        conversation_id = request.conversation_id or new_conversation_id()
 
         response = await agent.invoke(request.message, conversation_id)
 
-        return ChatResponse(
-            response=response,
-            conversation_id=conversation_id,
-            model=model_id
+        # Returning a Response directly skips FastAPI's response_model
+        # re-validation; the decorator keeps the schema in the docs.
+        return ORJSONResponse({
+            "response": response,
+            "conversation_id": conversation_id,
+            "model": model_id
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/batch", response_model=BatchChatResponse)
+async def chat_batch(request: BatchChatRequest):
+    """
+    Send multiple messages and get all responses.
+
+    Requests are fanned out concurrently with asyncio.gather so provider
+    calls overlap instead of running serially.
+
+    Args:
+        request: BatchChatRequest with a list of chat requests
+
+    Returns:
+        BatchChatResponse with responses in request order
+    """
+    for item in request.requests:
+        if not item.message.strip():
+            raise HTTPException(status_code=400, detail="Message cannot be empty")
+
+    async def run_one(item: ChatRequest) -> dict:
+        """Process a single chat request."""
+        model_id = item.model or settings.default_model
+        thinking = item.thinking if item.thinking is not None else False
+        agent = get_agent(model_id, thinking)
+        conversation_id = item.conversation_id or new_conversation_id()
+
+        response = await agent.invoke(item.message, conversation_id)
+
+        return {
+            "response": response,
+            "conversation_id": conversation_id,
+            "model": model_id
+        }
+
+    try:
+        responses = await asyncio.gather(
+            *(run_one(item) for item in request.requests)
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    return ORJSONResponse({"responses": list(responses), "count": len(responses)})
+
 
 @router.post("/stream")
 async def chat_stream(request: ChatRequest):
@@ -94,16 +192,69 @@ async def chat_stream(request: ChatRequest):
     if not request.message.strip():
         raise HTTPException(status_code=400, detail="Message cannot be empty")
 
-    conversation_id = request.conversation_id or str(uuid.uuid4())
+    conversation_id = request.conversation_id or new_conversation_id()
     model_id = request.model or settings.default_model
     thinking = request.thinking if request.thinking is not None else False
 
     async def generate():
-        """Generate streaming response chunks."""
+        """Generate streaming response chunks.
+
+        Chunks arriving within the coalescing window are concatenated
+        before being yielded, cutting per-chunk ASGI overhead at high
+        token rates. The flush timer runs against the producer: waiting
+        for the next chunk times out when the window expires, so
+        buffered tokens go out even if the model stalls mid-response.
+        The buffer also flushes once it reaches the size threshold, and
+        the first chunk is passed through immediately so
+        time-to-first-token is unaffected.
+        """
         try:
             agent = get_agent(model_id, thinking)
-            async for chunk in agent.stream(request.message, conversation_id):
-                yield chunk
+            loop = asyncio.get_running_loop()
+            buffer = []
+            buffered = 0
+            flush_at = 0.0
+            first = True
+            iterator = agent.stream(request.message, conversation_id).__aiter__()
+            pending = None
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(iterator))
+                try:
+                    if buffer:
+                        # shield() so a timeout only flushes the buffer
+                        # instead of cancelling the agent stream
+                        # mid-chunk
+                        chunk = await asyncio.wait_for(
+                            asyncio.shield(pending), flush_at - loop.time()
+                        )
+                    else:
+                        # Nothing buffered means nothing to flush on a
+                        # stall; wait for the producer without waking
+                        # on a timer
+                        chunk = await pending
+                except asyncio.TimeoutError:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered = 0
+                    continue
+                except StopAsyncIteration:
+                    break
+                pending = None
+                if first:
+                    first = False
+                    yield chunk
+                    continue
+                if not buffer:
+                    flush_at = loop.time() + _STREAM_COALESCE_WINDOW
+                buffer.append(chunk)
+                buffered += len(chunk)
+                if buffered >= _STREAM_COALESCE_BYTES:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered = 0
+            if buffer:
+                yield "".join(buffer)
         except Exception as e:
             yield f"\n[Error: {str(e)}]"
 
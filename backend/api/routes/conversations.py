@@ -2,6 +2,8 @@
 Conversation management endpoints.
 """
 
+from datetime import datetime
+
 from fastapi import APIRouter, HTTPException, Query
 from typing import Optional
 
@@ -26,7 +28,9 @@ from backend.api.routes.chat import _storage
 @router.get("/", response_model=ConversationsResponse)
 async def list_conversations(
     limit: int = Query(50, ge=1, le=100, description="Maximum number of conversations to return"),
-    offset: int = Query(0, ge=0, description="Number of conversations to skip")
+    offset: int = Query(0, ge=0, description="Number of conversations to skip"),
+    after_updated_at: Optional[str] = Query(None, description="Keyset cursor from a previous page"),
+    after_id: Optional[str] = Query(None, description="Keyset cursor from a previous page")
 ):
     """
     List all conversations.
@@ -34,14 +38,44 @@ async def list_conversations(
     Args:
         limit: Maximum number of conversations to return (1-100)
         offset: Number of conversations to skip
+        after_updated_at: Keyset cursor from a previous response; with
+            after_id, pages in O(limit) regardless of depth
+        after_id: Keyset cursor companion to after_updated_at
 
     Returns:
-        List of conversations with metadata
+        List of conversations with metadata and the cursor for the next page
     """
-    conversations = await _storage.list_conversations(limit=limit, offset=offset)
+    # The cursor only works as a pair; a half-supplied one would be
+    # silently ignored by the backends and serve page 1 again
+    if (after_updated_at is None) != (after_id is None):
+        raise HTTPException(
+            status_code=422,
+            detail="after_updated_at and after_id must be supplied together"
+        )
+    if after_updated_at is not None:
+        # The cursor comes straight from the client; reject malformed
+        # timestamps here instead of letting the storage backend raise
+        try:
+            datetime.fromisoformat(after_updated_at)
+        except ValueError:
+            raise HTTPException(
+                status_code=422,
+                detail="after_updated_at is not a valid ISO-8601 timestamp"
+            )
+
+    conversations = await _storage.list_conversations(
+        limit=limit,
+        offset=offset,
+        after_updated_at=after_updated_at,
+        after_id=after_id
+    )
+    # A full page may have more behind it; hand back where to resume
+    last = conversations[-1] if len(conversations) == limit else None
     return ConversationsResponse(
         conversations=[ConversationInfo(**conv) for conv in conversations],
-        count=len(conversations)
+        count=len(conversations),
+        next_after_updated_at=last["updated_at"] if last else None,
+        next_after_id=last["id"] if last else None
     )
 
 
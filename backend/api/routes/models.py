@@ -2,10 +2,9 @@
 Model and provider information endpoints.
 """
 
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Response
 
-from backend.api.schemas import ModelsResponse, ModelInfo, ProviderInfo
+from backend.api.schemas import ModelsResponse
 from backend.providers import ProviderFactory, ProviderRegistry
 
 router = APIRouter(prefix="/models", tags=["models"])
@@ -18,14 +17,14 @@ async def list_models():
 
     Returns a list of all models with their provider information.
     """
-    models = ProviderFactory.list_all_models()
-    return ModelsResponse(
-        models=[ModelInfo(**model) for model in models],
-        count=len(models)
+    # Payload is pre-serialized and only rebuilt when the registry changes
+    return Response(
+        content=ProviderFactory.list_all_models_json(),
+        media_type="application/json"
     )
 
 
-@router.get("/providers", response_model=List[str])
+@router.get("/providers")
 async def list_providers():
     """
     List all available provider names.
@@ -35,7 +34,7 @@ async def list_providers():
     return ProviderRegistry.list_providers()
 
 
-@router.get("/providers/{provider_name}", response_model=ProviderInfo)
+@router.get("/providers/{provider_name}")
 async def get_provider_info(provider_name: str):
     """
     Get detailed information about a specific provider.
@@ -44,11 +43,12 @@ async def get_provider_info(provider_name: str):
         provider_name: Provider ID (e.g., 'mistral', 'qwen')
 
     Returns:
-        Provider information including available models
+        Provider information including available models (see ProviderInfo)
     """
     try:
-        info = ProviderFactory.get_provider_info(provider_name)
-        return ProviderInfo(**info)
+        # The dict already matches ProviderInfo; skip response re-validation
+        # and let the default ORJSONResponse serialize it directly.
+        return ProviderFactory.get_provider_info(provider_name)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
@@ -5,8 +5,7 @@ Provides endpoints for the multi-agent debate workflow with
 Moderator-Expert-Critic collaboration.
 """
 
-import json
-import uuid
+import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 
@@ -16,6 +15,7 @@ from backend.api.schemas import (
     MultiAgentModelConfig,
     ThinkingConfig
 )
+from backend.api.routes.chat import new_conversation_id
 from backend.core.multi_agent import MultiAgentDebateWorkflow
 from backend.storage import get_storage
 from backend.config import settings
@@ -145,7 +145,7 @@ async def multi_agent_chat(request: MultiAgentChatRequest):
             thinking_critic=thinking.critic
         )
 
-        conversation_id = request.conversation_id or str(uuid.uuid4())
+        conversation_id = request.conversation_id or new_conversation_id()
 
         # Run the workflow
         result = await workflow.invoke(request.message, conversation_id)
@@ -191,7 +191,7 @@ async def multi_agent_chat_stream(request: MultiAgentChatRequest):
 
     # Resolve models
     moderator_model, expert_model, critic_model = resolve_models(request.models)
-    conversation_id = request.conversation_id or str(uuid.uuid4())
+    conversation_id = request.conversation_id or new_conversation_id()
 
     # Extract thinking configuration
     thinking = request.thinking or ThinkingConfig()
@@ -211,15 +211,15 @@ async def multi_agent_chat_stream(request: MultiAgentChatRequest):
             )
 
             async for event in workflow.stream(request.message, conversation_id):
-                # Format as SSE event
-                event_data = json.dumps(event, ensure_ascii=False)
+                # Format as SSE event (orjson emits UTF-8, no ASCII escaping)
+                event_data = orjson.dumps(event).decode()
                 yield f"data: {event_data}\n\n"
 
         except Exception as e:
-            error_event = json.dumps({
+            error_event = orjson.dumps({
                 "type": "error",
                 "error": str(e)
-            }, ensure_ascii=False)
+            }).decode()
             yield f"data: {error_event}\n\n"
 
     return StreamingResponse(
@@ -40,6 +40,27 @@ class ChatResponse(BaseModel):
         }
 
 
+class BatchChatRequest(BaseModel):
+    """Request model for the batch chat endpoint."""
+    requests: List[ChatRequest] = Field(..., description="Chat requests to process concurrently", min_length=1)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "requests": [
+                    {"message": "What is machine learning?", "model": "mistral-large-latest"},
+                    {"message": "What is deep learning?", "model": "qwen3-max"}
+                ]
+            }
+        }
+
+
+class BatchChatResponse(BaseModel):
+    """Response model for the batch chat endpoint."""
+    responses: List[ChatResponse] = Field(..., description="Responses in the same order as the requests")
+    count: int = Field(..., description="Number of responses")
+
+
 class HealthResponse(BaseModel):
     """Response model for health check."""
     status: str = Field(..., description="Service status")
@@ -94,6 +115,14 @@ class ConversationsResponse(BaseModel):
     """Response model for listing conversations."""
     conversations: List[ConversationInfo] = Field(..., description="List of conversations")
     count: int = Field(..., description="Total number of conversations")
+    next_after_updated_at: Optional[str] = Field(
+        None,
+        description="Keyset cursor for the next page; pass back as after_updated_at"
+    )
+    next_after_id: Optional[str] = Field(
+        None,
+        description="Keyset cursor for the next page; pass back as after_id"
+    )
 
 
 class MessageInfo(BaseModel):
@@ -19,10 +19,35 @@ class Settings(BaseSettings):
     api_port: int = 8000
     cors_origins: List[str] = ["*"]
 
+    # Uvicorn tuning. More than one worker forks separate processes,
+    # and neither bundled storage backend is coherent across them:
+    # memory is per-process, and sqlite keeps per-process write buffers
+    # and caches with no cross-process invalidation. Only raise this
+    # with a genuinely shared backend (e.g. redis/postgres).
+    uvicorn_workers: int = 1
+    uvicorn_backlog: int = 2048
+    uvicorn_timeout_keep_alive: int = 30
+
     # Model Configuration
     default_model: str = "mistral"
     model_temperature: float = 0.7
 
+    # Cache LLM completions in-process so repeat prompts skip the
+    # network. Off by default: cached answers are only correct for
+    # deterministic settings (temperature=0), since the cache replays
+    # the stored completion for an identical prompt + parameters.
+    llm_response_cache: bool = False
+
+    # Upper bound on cached completions; oldest entries are evicted
+    # once full, so a long-lived process can't grow without limit on
+    # unique prompts.
+    llm_response_cache_size: int = 1024
+
+    # Models whose clients are pre-built at startup so the first chat
+    # request doesn't pay client construction and TLS setup. Models
+    # without a configured API key are skipped.
+    warmup_models: List[str] = []
+
     # Provider API Keys
     mistral_api_key: Optional[str] = None
     qwen_api_key: Optional[str] = None
@@ -2,6 +2,7 @@
 Core LangGraph agent implementation with provider and storage abstractions.
 """
 
+import asyncio
 from typing import TypedDict, Annotated, Optional
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
@@ -203,7 +204,10 @@ class LangGraphAgent:
 
         initial_state = {"messages": messages}
 
-        result = self.graph.invoke(initial_state)
+        # graph.invoke is synchronous (LLM round-trip included); run it
+        # on a worker thread so concurrent requests don't serialize on
+        # the event loop
+        result = await asyncio.to_thread(self.graph.invoke, initial_state)
         raw_content = result["messages"][-1].content
         response = self._extract_text_content(raw_content)
 
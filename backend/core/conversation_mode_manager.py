@@ -65,8 +65,14 @@ class ConversationModeManager:
                 "message": f"Already in {target_mode} mode"
             }
 
-        # Prepare metadata update
+        # Prepare metadata update. Debate state is not part of it:
+        # storage keeps that in its own slot (a dedicated column on
+        # sqlite), so it goes through the debate-state API below rather
+        # than being smuggled into the metadata merge, where sqlite
+        # would never see it
         metadata = conversation.get("metadata", {})
+        metadata.pop("debate_state", None)
+        debate_state = None
 
         if target_mode == "debate":
             # Switching to debate mode
@@ -79,7 +85,7 @@ class ConversationModeManager:
             # Build conversation context for debate
             context = await self.prepare_debate_context(conversation_id)
             if context:
-                metadata["debate_state"] = {
+                debate_state = {
                     "conversation_context": context,
                     "previous_summary": "",
                     "last_iteration": 0
@@ -91,9 +97,10 @@ class ConversationModeManager:
             # Switching to simple mode
             # Clear debate-specific metadata
             metadata.pop("model_config", None)
-            # Keep debate_state for history but mark as inactive
-            if "debate_state" in metadata:
-                metadata["debate_state"]["active"] = False
+            # Keep debate state for history but mark as inactive
+            debate_state = await self.storage.get_debate_state(conversation_id)
+            if debate_state is not None:
+                debate_state["active"] = False
 
             message = "Switched to simple mode. Debate configuration cleared."
 
@@ -104,6 +111,9 @@ class ConversationModeManager:
             metadata=metadata
         )
 
+        if debate_state is not None:
+            await self.storage.update_debate_state(conversation_id, debate_state)
+
         logger.info(f"Switched conversation {conversation_id} from {current_mode} to {target_mode}")
 
         return {
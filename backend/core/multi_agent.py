@@ -9,15 +9,17 @@ This module implements a three-role multi-agent collaboration system:
 Uses LangGraph for workflow orchestration with sliding window memory management.
 """
 
+import asyncio
 import json
 import re
 import logging
+from collections import deque
 from datetime import datetime
 from typing import Optional, AsyncGenerator, Literal
 
 from langgraph.graph import StateGraph, END
 
-from backend.providers import ProviderFactory
+from backend.providers import ProviderFactory, ProviderRegistry
 from backend.storage import ConversationStorage, MemoryStorage
 from backend.core.multi_agent_state import MultiAgentState, create_initial_state
 from backend.core.prompts import (
@@ -34,11 +36,14 @@ from backend.core.prompts import (
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; this runs on every structured LLM response
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)```')
+
 
 def extract_json_from_response(text: str) -> dict:
     """Extract JSON from LLM response, handling markdown code blocks."""
     # Try to find JSON in code blocks first
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', text)
+    json_match = _JSON_BLOCK_RE.search(text)
     if json_match:
         json_str = json_match.group(1).strip()
     else:
@@ -53,6 +58,35 @@ def extract_json_from_response(text: str) -> dict:
         return {"error": "Failed to parse response", "raw": text}
 
 
+def append_iteration_summary(
+    previous_summary: str,
+    iteration_summary: str,
+    max_entries: int
+) -> str:
+    """
+    Append an iteration summary while keeping only the most recent entries.
+
+    The summary is fed back into every synthesis prompt, so unbounded
+    concatenation grows prompt tokens quadratically over long debates.
+    A small ring buffer of the latest entries keeps per-call cost bounded.
+
+    Args:
+        previous_summary: Accumulated summary (one entry per line)
+        iteration_summary: New entry to append (may be empty)
+        max_entries: Maximum number of summary lines to retain
+
+    Returns:
+        Updated summary string with at most max_entries lines
+    """
+    entries = deque(
+        (line for line in previous_summary.splitlines() if line.strip()),
+        maxlen=max(max_entries, 1)
+    )
+    if iteration_summary and iteration_summary.strip():
+        entries.append(iteration_summary.strip())
+    return "\n".join(entries)
+
+
 class MultiAgentDebateWorkflow:
     """
     Multi-agent debate workflow with Moderator-Expert-Critic roles.
@@ -123,21 +157,16 @@ class MultiAgentDebateWorkflow:
         self.max_iterations = max_iterations
         self.score_threshold = score_threshold
 
-        # Initialize LLMs for each role with thinking parameters
-        self.moderator_llm = ProviderFactory.create_llm(
-            model_id=moderator_model,
-            temperature=temperature,
-            thinking=thinking_moderator
+        # Initialize LLMs for each role with thinking parameters.
+        # JSON mode is resolved once per role here to avoid branching per call.
+        self.moderator_llm, self._moderator_json_mode = self._create_role_llm(
+            moderator_model, temperature, thinking_moderator
         )
-        self.expert_llm = ProviderFactory.create_llm(
-            model_id=expert_model,
-            temperature=temperature,
-            thinking=thinking_expert
+        self.expert_llm, self._expert_json_mode = self._create_role_llm(
+            expert_model, temperature, thinking_expert
         )
-        self.critic_llm = ProviderFactory.create_llm(
-            model_id=critic_model,
-            temperature=temperature,
-            thinking=thinking_critic
+        self.critic_llm, self._critic_json_mode = self._create_role_llm(
+            critic_model, temperature, thinking_critic
         )
 
         # Initialize storage
@@ -146,15 +175,79 @@ class MultiAgentDebateWorkflow:
         # Build the LangGraph workflow
         self.graph = self._build_graph()
 
-    def _build_graph(self):
-        """Build the LangGraph workflow with conditional branching."""
+    @staticmethod
+    def _create_role_llm(model_id: str, temperature: Optional[float], thinking: bool):
+        """
+        Create an LLM for a debate role, enabling provider JSON mode when available.
+
+        Args:
+            model_id: Model ID for the role
+            temperature: LLM temperature (defaults to config)
+            thinking: Enable thinking for this role
+
+        Returns:
+            Tuple of (llm, json_mode) where json_mode indicates the provider
+            guarantees raw JSON responses (no markdown fences)
+        """
+        provider_name, provider = ProviderRegistry.find_provider_for_model(model_id)
+        json_mode = provider.supports_json_mode(model_id)
+        kwargs = {"response_format": {"type": "json_object"}} if json_mode else {}
+        llm = ProviderFactory.create_llm(
+            model_id=model_id,
+            provider_name=provider_name,
+            temperature=temperature,
+            thinking=thinking,
+            **kwargs
+        )
+        return llm, json_mode
+
+    @staticmethod
+    def _parse_structured_response(text: str, json_mode: bool) -> dict:
+        """
+        Parse a structured LLM response.
+
+        In JSON mode the provider guarantees raw JSON, so parse directly and
+        skip the regex-based markdown-fence stripping entirely.
+        """
+        if json_mode:
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError:
+                # Provider contract violated; fall back to lenient parsing
+                logger.warning("JSON mode response was not valid JSON, falling back")
+        return extract_json_from_response(text)
+
+    # Compiled LangGraph shared by all workflow instances. The graph topology
+    # does not depend on per-instance configuration (models, storage,
+    # thresholds), so it is compiled once and reused; nodes dispatch to the
+    # owning instance through state["_workflow"].
+    _compiled_graph = None
+
+    @classmethod
+    def _build_graph(cls):
+        """Build (or reuse) the shared LangGraph workflow with conditional branching."""
+        if cls._compiled_graph is not None:
+            return cls._compiled_graph
+
         workflow = StateGraph(MultiAgentState)
 
-        # Add nodes
-        workflow.add_node("moderator_init", self._moderator_init_node)
-        workflow.add_node("expert_generate", self._expert_generate_node)
-        workflow.add_node("critic_review", self._critic_review_node)
-        workflow.add_node("moderator_synthesize", self._moderator_synthesize_node)
+        # Add nodes (dispatching through the owning workflow instance)
+        workflow.add_node(
+            "moderator_init",
+            lambda state: state["_workflow"]._moderator_init_node(state)
+        )
+        workflow.add_node(
+            "expert_generate",
+            lambda state: state["_workflow"]._expert_generate_node(state)
+        )
+        workflow.add_node(
+            "critic_review",
+            lambda state: state["_workflow"]._critic_review_node(state)
+        )
+        workflow.add_node(
+            "moderator_synthesize",
+            lambda state: state["_workflow"]._moderator_synthesize_node(state)
+        )
 
         # Set entry point
         workflow.set_entry_point("moderator_init")
@@ -162,7 +255,7 @@ class MultiAgentDebateWorkflow:
         # Add conditional edges from moderator_init
         workflow.add_conditional_edges(
             "moderator_init",
-            self._route_after_init,
+            cls._route_after_init,
             {
                 "direct": END,
                 "expert": "expert_generate"
@@ -178,22 +271,25 @@ class MultiAgentDebateWorkflow:
         # Conditional edges from moderator_synthesize
         workflow.add_conditional_edges(
             "moderator_synthesize",
-            self._route_after_synthesize,
+            cls._route_after_synthesize,
             {
                 "continue": "expert_generate",
                 "end": END
             }
         )
 
-        return workflow.compile()
+        cls._compiled_graph = workflow.compile()
+        return cls._compiled_graph
 
-    def _route_after_init(self, state: MultiAgentState) -> Literal["direct", "expert"]:
+    @staticmethod
+    def _route_after_init(state: MultiAgentState) -> Literal["direct", "expert"]:
         """Route based on moderator's complexity assessment."""
         if state["status"] == "direct_answer":
             return "direct"
         return "expert"
 
-    def _route_after_synthesize(self, state: MultiAgentState) -> Literal["continue", "end"]:
+    @staticmethod
+    def _route_after_synthesize(state: MultiAgentState) -> Literal["continue", "end"]:
         """Route based on moderator's synthesis decision."""
         if state["status"] == "completed":
             return "end"
@@ -218,7 +314,7 @@ class MultiAgentDebateWorkflow:
 
         response = self.moderator_llm.invoke([{"role": "user", "content": prompt}])
         text_content = self._extract_text_content(response.content)
-        result = extract_json_from_response(text_content)
+        result = self._parse_structured_response(text_content, self._moderator_json_mode)
 
         if "error" in result:
             # Fallback: treat as complex question
@@ -313,7 +409,7 @@ class MultiAgentDebateWorkflow:
 
         response = self.expert_llm.invoke([{"role": "user", "content": prompt}])
         text_content = self._extract_text_content(response.content)
-        result = extract_json_from_response(text_content)
+        result = self._parse_structured_response(text_content, self._expert_json_mode)
 
         if "error" in result:
             # Fallback: create basic answer structure
@@ -345,7 +441,7 @@ class MultiAgentDebateWorkflow:
 
         response = self.critic_llm.invoke([{"role": "user", "content": prompt}])
         text_content = self._extract_text_content(response.content)
-        result = extract_json_from_response(text_content)
+        result = self._parse_structured_response(text_content, self._critic_json_mode)
 
         if "error" in result:
             # Fallback: create basic review structure
@@ -418,7 +514,7 @@ class MultiAgentDebateWorkflow:
 
         response = self.moderator_llm.invoke([{"role": "user", "content": prompt}])
         text_content = self._extract_text_content(response.content)
-        result = extract_json_from_response(text_content)
+        result = self._parse_structured_response(text_content, self._moderator_json_mode)
 
         # Determine final termination status
         should_end = forced_termination or result.get("decision") == "end"
@@ -443,7 +539,11 @@ class MultiAgentDebateWorkflow:
                 "status": "completed",
                 "final_answer": final_answer,
                 "termination_reason": termination_reason,
-                "previous_summary": state.get("previous_summary", "") + "\n" + result.get("iteration_summary", ""),
+                "previous_summary": append_iteration_summary(
+                    state.get("previous_summary", ""),
+                    result.get("iteration_summary", ""),
+                    self.max_iterations
+                ),
                 "moderator_synthesize_analysis": {
                     "feedback_validation": result.get("feedback_validation"),
                     "decision": result.get("decision"),
@@ -456,12 +556,16 @@ class MultiAgentDebateWorkflow:
             # Continue iteration
             # Update summary with current iteration info
             iteration_summary = result.get("iteration_summary", f"第{iteration}轮: 评分{score}, 继续改进。")
-            new_summary = state.get("previous_summary", "") + "\n" + iteration_summary
+            new_summary = append_iteration_summary(
+                state.get("previous_summary", ""),
+                iteration_summary,
+                self.max_iterations
+            )
 
             return {
                 "iteration": iteration + 1,
                 "improvement_guidance": result.get("improvement_guidance", "请继续改进回答。"),
-                "previous_summary": new_summary.strip(),
+                "previous_summary": new_summary,
                 "current_task": result.get("improvement_guidance", state["current_task"]),
                 "moderator_synthesize_analysis": {
                     "feedback_validation": result.get("feedback_validation"),
@@ -472,6 +576,24 @@ class MultiAgentDebateWorkflow:
                 }
             }
 
+    async def _invoke_node(self, node_name: str, state: MultiAgentState) -> dict:
+        """
+        Run a graph node in a worker thread.
+
+        Node bodies are pure CPU plus blocking LLM calls — regex/JSON parsing
+        of multi-KB responses alone can stall the loop for tens of ms — so
+        they are kept off the event loop to stay responsive under concurrent
+        debates.
+
+        Args:
+            node_name: Name of the graph node to invoke
+            state: Current workflow state
+
+        Returns:
+            State update dict returned by the node
+        """
+        return await asyncio.to_thread(self.graph.nodes[node_name].invoke, state)
+
     async def _load_debate_state(
         self,
         conversation_id: str
@@ -485,12 +607,7 @@ class MultiAgentDebateWorkflow:
         Returns:
             Debate state dict or None
         """
-        conversation = await self.storage.get_conversation(conversation_id)
-        if not conversation:
-            return None
-
-        metadata = conversation.get("metadata", {})
-        return metadata.get("debate_state")
+        return await self.storage.get_debate_state(conversation_id)
 
     async def _save_debate_state(
         self,
@@ -607,6 +724,8 @@ class MultiAgentDebateWorkflow:
             previous_summary=debate_state.get("previous_summary", "") if debate_state else "",
             conversation_context=debate_state.get("conversation_context", "") if debate_state else ""
         )
+        # Attach self so the shared compiled graph can resolve instance LLMs
+        initial_state["_workflow"] = self
 
         try:
             # Yield initial phase
@@ -621,7 +740,7 @@ class MultiAgentDebateWorkflow:
             current_state = initial_state
 
             # Step 1: Moderator Init
-            result = self.graph.nodes["moderator_init"].invoke(current_state)
+            result = await self._invoke_node("moderator_init", current_state)
             current_state = {**current_state, **result}
 
             # Emit moderator init analysis
@@ -677,7 +796,7 @@ class MultiAgentDebateWorkflow:
                     "message": f"Expert generating answer (iteration {iteration})..."
                 }
 
-                result = self.graph.nodes["expert_generate"].invoke(current_state)
+                result = await self._invoke_node("expert_generate", current_state)
                 current_state = {**current_state, **result}
 
                 yield {
@@ -694,7 +813,7 @@ class MultiAgentDebateWorkflow:
                     "message": f"Critic reviewing answer (iteration {iteration})..."
                 }
 
-                result = self.graph.nodes["critic_review"].invoke(current_state)
+                result = await self._invoke_node("critic_review", current_state)
                 current_state = {**current_state, **result}
 
                 yield {
@@ -711,7 +830,7 @@ class MultiAgentDebateWorkflow:
                     "message": f"Moderator synthesizing results (iteration {iteration})..."
                 }
 
-                result = self.graph.nodes["moderator_synthesize"].invoke(current_state)
+                result = await self._invoke_node("moderator_synthesize", current_state)
                 current_state = {**current_state, **result}
 
                 # Emit moderator synthesize analysis
@@ -80,6 +80,10 @@ class MultiAgentState(TypedDict):
     # Message history for LangGraph compatibility
     messages: Annotated[list, add_messages]
 
+    # Owning workflow instance (set by MultiAgentDebateWorkflow.stream so the
+    # shared compiled graph can dispatch to instance-bound node methods)
+    _workflow: Optional[object]
+
 
 def create_initial_state(
     question: str,
@@ -102,5 +106,6 @@ def create_initial_state(
         final_answer=None,
         termination_reason=None,
         status="in_progress",
-        messages=[]
+        messages=[],
+        _workflow=None
     )
@@ -5,12 +5,38 @@ This is the refactored version of the original server.py
 with improved structure and organization.
 """
 
-from fastapi import FastAPI
+import logging
+import re
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 
 from backend.config import settings
 from backend.api.routes import api_router
+from backend.providers import ProviderFactory, ProviderRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-build LLM clients on startup, close storage on shutdown."""
+    for model_id in settings.warmup_models:
+        try:
+            ProviderFactory.create_llm(model_id)
+        except Exception as exc:
+            logger.warning(f"Warmup skipped for {model_id}: {exc}")
+    yield
+    # Graceful shutdown: flush buffered writes and release connections,
+    # so a clean SIGTERM can't drop messages still sitting in the
+    # sqlite write-behind buffer
+    from backend.api.routes import chat, multi_agent_chat
+    await chat._storage.close()
+    await multi_agent_chat._storage.close()
+
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -18,28 +44,83 @@ app = FastAPI(
     description="Multi-provider LLM chat API with streaming support",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Add CORS middleware
+# Add CORS middleware. A fixed origin list makes Starlette scan it on
+# every preflight; compiling the list into an anchored regex gives a
+# single match per request instead. The "*" wildcard has dedicated
+# fast-path handling in Starlette, so it is passed through as-is.
+if "*" in settings.cors_origins:
+    _cors_config = {"allow_origins": ["*"]}
+else:
+    _cors_config = {
+        "allow_origin_regex": "^(?:%s)$" % "|".join(
+            re.escape(origin) for origin in settings.cors_origins
+        )
+    }
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    **_cors_config,
 )
 
 # Include all API routes
 app.include_router(api_router)
 
+# Optional response-level cache: repeat prompts with identical
+# parameters short-circuit the provider round-trip entirely. Bounded,
+# so unique prompts can't grow it for the life of the process.
+if settings.llm_response_cache:
+    from langchain_core.caches import InMemoryCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(InMemoryCache(maxsize=settings.llm_response_cache_size))
+
+
+# The redirect is stateless, so one prebuilt response serves every
+# request instead of re-rendering status line and headers each time
+_DOCS_REDIRECT = RedirectResponse(url="/docs")
+
 
 @app.get("/", include_in_schema=False)
 async def root():
     """
     Root endpoint - redirects to API documentation.
     """
-    return RedirectResponse(url="/docs")
+    return _DOCS_REDIRECT
+
+
+# Human-readable endpoint directory served by /info
+_ENDPOINTS = {
+    "GET /": "API documentation (redirect)",
+    "GET /info": "API information",
+    "GET /health": "Health check",
+    "GET /models": "List all available models",
+    "GET /models/providers": "List all providers",
+    "GET /models/providers/{provider}": "Get provider info",
+    "POST /chat": "Send message, get complete response",
+    "POST /chat/stream": "Send message, get streaming response",
+    "GET /conversations": "List all conversations",
+    "GET /conversations/{id}": "Get conversation history",
+    "DELETE /conversations/{id}": "Delete conversation"
+}
+
+# The /info payload is static for the lifetime of the process, so it is
+# serialized once at import time instead of on every request.
+_INFO_BYTES = orjson.dumps({
+    "name": "LLM GUI API",
+    "version": "2.0.0",
+    "description": "Multi-provider LLM chat API",
+    "providers": ProviderRegistry.list_providers(),
+    "default_model": settings.default_model,
+    "endpoints": _ENDPOINTS
+})
 
 
 @app.get("/info")
@@ -47,36 +128,35 @@ async def info():
     """
     Get API information.
     """
-    from backend.providers import ProviderRegistry
-
-    return {
-        "name": "LLM GUI API",
-        "version": "2.0.0",
-        "description": "Multi-provider LLM chat API",
-        "providers": ProviderRegistry.list_providers(),
-        "default_model": settings.default_model,
-        "endpoints": {
-            "GET /": "API documentation (redirect)",
-            "GET /info": "API information",
-            "GET /health": "Health check",
-            "GET /models": "List all available models",
-            "GET /models/providers": "List all providers",
-            "GET /models/providers/{provider}": "Get provider info",
-            "POST /chat": "Send message, get complete response",
-            "POST /chat/stream": "Send message, get streaming response",
-            "GET /conversations": "List all conversations",
-            "GET /conversations/{id}": "Get conversation history",
-            "DELETE /conversations/{id}": "Delete conversation"
-        }
-    }
+    return Response(content=_INFO_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
 
+    # Prefer the faster event-loop / HTTP-parser implementations when the
+    # optional packages are installed (uvloop is not available on Windows).
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "auto"
+
+    # uvicorn needs an import string (not the app object) to fork workers
+    workers = settings.uvicorn_workers
     uvicorn.run(
-        app,
+        "backend.main:app" if workers > 1 else app,
         host=settings.api_host,
         port=settings.api_port,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        loop=loop_impl,
+        http=http_impl,
+        workers=workers,
+        backlog=settings.uvicorn_backlog,
+        timeout_keep_alive=settings.uvicorn_timeout_keep_alive
     )
@@ -3,15 +3,23 @@ LLM Provider module.
 
 This module provides abstractions for different LLM providers,
 allowing easy switching between models and providers.
+
+Provider classes are imported lazily (PEP 562) so that importing the
+package does not load every provider module up front.
 """
 
+import importlib
+
 from .base import BaseLLMProvider
 from .registry import ProviderRegistry
 from .factory import ProviderFactory
-from .mistral import MistralProvider
-from .qwen import QwenProvider
-from .glm import GLMProvider
-from .minimax import MiniMaxProvider
+
+_LAZY_CLASSES = {
+    "MistralProvider": ".mistral",
+    "QwenProvider": ".qwen",
+    "GLMProvider": ".glm",
+    "MiniMaxProvider": ".minimax",
+}
 
 __all__ = [
     "BaseLLMProvider",
@@ -22,3 +30,11 @@ __all__ = [
     "GLMProvider",
     "MiniMaxProvider",
 ]
+
+
+def __getattr__(name):
+    """Resolve provider classes on first attribute access."""
+    module_path = _LAZY_CLASSES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_path, __name__), name)
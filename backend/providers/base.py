@@ -4,19 +4,75 @@ Base class for LLM providers.
 
 import platform
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict
+from typing import Optional, Dict, Tuple
+
+
+# Process-wide async HTTP client shared by OpenAI-compatible providers
+# (created lazily so importing this module stays cheap)
+_shared_async_client = None
+
+
+def get_shared_async_client():
+    """
+    Return the shared httpx.AsyncClient used by OpenAI-compatible providers.
+
+    Sharing a single client keeps connections alive (and multiplexes over
+    HTTP/2 when the optional h2 package is installed) across all providers,
+    instead of every LLM client owning its own TLS pool.
+    """
+    global _shared_async_client
+    if _shared_async_client is None:
+        import httpx
+        # Sized for many concurrent chat requests: the default pool caps
+        # out well below what an LLM fan-out server needs, and a generous
+        # keepalive window keeps TLS sessions warm between requests.
+        limits = httpx.Limits(
+            max_connections=200,
+            max_keepalive_connections=100,
+            keepalive_expiry=60
+        )
+        try:
+            _shared_async_client = httpx.AsyncClient(http2=True, limits=limits)
+        except ImportError:
+            # h2 not installed; fall back to HTTP/1.1 keep-alive
+            _shared_async_client = httpx.AsyncClient(limits=limits)
+    return _shared_async_client
 
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
+    # Providers are stateless; empty __slots__ keeps instances dict-free
+    __slots__ = ()
+
+    # Lookup tables generated from each subclass's model table at class
+    # creation (see __init_subclass__); used for O(1) checks without
+    # scanning the model list per call.
+    _MODEL_IDS: frozenset = frozenset()
+    _THINKING_IDS: frozenset = frozenset()
+    _LOCKED_IDS: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        """Precompute model-id lookup tables for concrete providers."""
+        super().__init_subclass__(**kwargs)
+        if getattr(cls.get_available_models, "__isabstractmethod__", False):
+            return
+        models = cls().get_available_models()
+        cls._MODEL_IDS = frozenset(m["id"] for m in models)
+        cls._THINKING_IDS = frozenset(
+            m["id"] for m in models if m.get("supports_thinking", False)
+        )
+        cls._LOCKED_IDS = frozenset(
+            m["id"] for m in models if m.get("thinking_locked", False)
+        )
+
     @abstractmethod
-    def get_available_models(self) -> List[Dict[str, str]]:
+    def get_available_models(self) -> Tuple[Dict[str, str], ...]:
         """
-        Return list of available models for this provider.
+        Return the available models for this provider.
 
         Returns:
-            List of dicts with 'id', 'name', and 'description' keys
+            Tuple of dicts with 'id', 'name', and 'description' keys
             Example: [
                 {
                     "id": "mistral-large-latest",
@@ -84,28 +140,59 @@ class BaseLLMProvider(ABC):
         Raises:
             ValueError: If model_id is not supported
         """
-        available_model_ids = [m["id"] for m in self.get_available_models()]
-        if model_id not in available_model_ids:
+        model_ids = self._MODEL_IDS or frozenset(m["id"] for m in self.get_available_models())
+        if model_id not in model_ids:
+            available = ", ".join(m["id"] for m in self.get_available_models())
             raise ValueError(
                 f"Model '{model_id}' not supported by {self.get_provider_name()}. "
-                f"Available models: {', '.join(available_model_ids)}"
+                f"Available models: {available}"
             )
         return model_id
     
     def supports_thinking(self, model_id:str):
         """Check if supports thinking"""
-        for model in self.get_available_models():
-            if model.get('id') == model_id and model.get('supports_thinking', False):
-                return True
-        return False
-    
+        return model_id in self._THINKING_IDS
+
     def is_thinking_locked(self, model_id:str):
         """Check is thinking locked"""
-        for model in self.get_available_models():
-            if model.get('id') == model_id and model.get('thinking_locked', False):
-                return True
+        return model_id in self._LOCKED_IDS
+
+    def supports_json_mode(self, model_id: str) -> bool:
+        """
+        Check if the provider guarantees valid JSON output for this model
+        when initialized with response_format={"type": "json_object"}.
+
+        Providers that return True can skip the lenient markdown-fence
+        parsing on structured responses.
+        """
+        _ = model_id
         return False
 
+    async def abatch(self, llm, prompts, max_concurrency: int = 8):
+        """
+        Run several prompts through one initialized client concurrently.
+
+        Delegates to the client's native abatch, which coalesces the
+        requests and bounds fan-out via max_concurrency — the preferred
+        path for bulk work (e.g. summarizing many messages) over calling
+        invoke in a Python-level loop.
+
+        Args:
+            llm: Client returned by initialize()
+            prompts: Iterable of prompts/message lists
+            max_concurrency: Maximum in-flight requests (default: 8)
+
+        Returns:
+            List of responses in prompt order
+        """
+        return await llm.abatch(
+            list(prompts), config={"max_concurrency": max_concurrency}
+        )
+
+    # Computed once on first use; platform details don't change while
+    # the process is running
+    _user_agent_cache: Optional[str] = None
+
     def get_user_agent(self) -> str:
         """
         Generate a standard user-agent string for API requests.
@@ -113,7 +200,11 @@ class BaseLLMProvider(ABC):
         Returns:
             User-agent string in standard format
         """
-        system = platform.system()
-        release = platform.release()
-        python_version = platform.python_version()
-        return f"UnifyLLM/1.0 ({system} {release}; Python/{python_version})"
+        ua = BaseLLMProvider._user_agent_cache
+        if ua is None:
+            system = platform.system()
+            release = platform.release()
+            python_version = platform.python_version()
+            ua = f"UnifyLLM/1.0 ({system} {release}; Python/{python_version})"
+            BaseLLMProvider._user_agent_cache = ua
+        return ua
@@ -2,74 +2,44 @@
 DeepSeek provider implementation.
 """
 
-from typing import List, Dict
-from langchain_openai import ChatOpenAI
-from .base import BaseLLMProvider
-
-
-class DeepSeekProvider(BaseLLMProvider):
+from typing import Dict, Tuple
+from .openai_compatible import OpenAICompatibleProvider
+
+
+_MODELS: Tuple[Dict[str, str], ...] = (
+    {
+        "id": "deepseek-chat",
+        "name": "DeepSeek Chat (V3.2)",
+        "description": "DeepSeek's conversational model",
+        "supports_thinking": False
+    },
+    {
+        "id": "deepseek-reasoner",
+        "name": "DeepSeek Reasoner (V3.2)",
+        "description": "Advanced reasoning model with chain-of-thought",
+        "supports_thinking": True,
+        "thinking_locked": True  # Cannot disable thinking
+    },
+)
+
+
+class DeepSeekProvider(OpenAICompatibleProvider):
     """DeepSeek provider using OpenAI-compatible API."""
 
-    # Models that support thinking (always on, cannot be disabled)
-
-    def get_available_models(self) -> List[Dict[str, str]]:
-        """Return available DeepSeek models."""
-        return [
-            {
-                "id": "deepseek-chat",
-                "name": "DeepSeek Chat (V3.2)",
-                "description": "DeepSeek's conversational model",
-                "supports_thinking": False
-            },
-            {
-                "id": "deepseek-reasoner",
-                "name": "DeepSeek Reasoner (V3.2)",
-                "description": "Advanced reasoning model with chain-of-thought",
-                "supports_thinking": True,
-                "thinking_locked": True  # Cannot disable thinking
-            },
-        ]
-
-    def get_provider_name(self) -> str:
-        """Return the provider name."""
-        return "DeepSeek"
-
-    def supports_streaming(self) -> bool:
-        """DeepSeek supports streaming."""
-        return True
+    __slots__ = ()
 
-    def initialize(self, model_id: str, api_key: str, temperature: float = 0.7, thinking: bool = False, **kwargs):
-        """
-        Initialize DeepSeek LLM client.
+    PROVIDER_NAME = "DeepSeek"
+    DEFAULT_BASE_URL = "https://api.deepseek.com"
 
-        Args:
-            model_id: DeepSeek model ID (e.g., 'deepseek-chat')
-            api_key: DeepSeek API key
-            temperature: Sampling temperature (default: 0.7)
-            thinking: Ignored for deepseek-reasoner (always thinks)
-            **kwargs: Additional configuration (e.g., base_url)
-
-        Returns:
-            ChatOpenAI instance configured for DeepSeek
-        """
-        validated_key = self.validate_api_key(api_key)
-        validated_model = self.validate_model_id(model_id)
+    def get_available_models(self) -> Tuple[Dict[str, str], ...]:
+        """Return available DeepSeek models."""
+        return _MODELS
 
-        base_url = kwargs.get("base_url", "https://api.deepseek.com")
+    def supports_json_mode(self, model_id: str) -> bool:
+        """deepseek-chat supports JSON output mode; the reasoner does not."""
+        return model_id == "deepseek-chat"
 
-        # DeepSeek Reasoner doesn't support temperature parameter
-        if validated_model == "deepseek-reasoner":
-            return ChatOpenAI(
-                model=validated_model,
-                api_key=validated_key,
-                base_url=base_url,
-                streaming=True
-            )
-        else:
-            return ChatOpenAI(
-                model=validated_model,
-                api_key=validated_key,
-                base_url=base_url,
-                temperature=temperature,
-                streaming=True
-            )
+    def _customize_client_kwargs(self, client_kwargs: Dict, model_id: str, thinking: bool):
+        """DeepSeek Reasoner doesn't support the temperature parameter."""
+        if model_id == "deepseek-reasoner":
+            del client_kwargs["temperature"]
@@ -2,7 +2,10 @@
 Factory for creating and initializing LLM provider instances.
 """
 
+import threading
 from typing import Optional
+
+import orjson
 from .base import BaseLLMProvider
 from .registry import ProviderRegistry
 from backend.config import settings
@@ -11,6 +14,13 @@ from backend.config import settings
 class ProviderFactory:
     """Factory for creating initialized LLM instances."""
 
+    # Cache of initialized LLM clients keyed by their full configuration.
+    # Client construction is expensive (httpx pool, Pydantic model init) and
+    # clients are stateless between calls, so instances are shared; this also
+    # keeps HTTP connections alive across chat requests.
+    _llm_cache: dict = {}
+    _llm_cache_lock = threading.Lock()
+
     @staticmethod
     def create_llm(
         model_id: str,
@@ -41,11 +51,14 @@ class ProviderFactory:
         if temperature is None:
             temperature = settings.model_temperature
 
-        # Auto-detect provider if not specified
+        # Auto-detect provider if not specified. Auto-detection already
+        # proves the model exists, so the explicit check is only needed
+        # when the caller named the provider themselves.
         if provider_name is None:
             provider_name, provider = ProviderRegistry.find_provider_for_model(model_id)
         else:
             provider = ProviderRegistry.get_provider(provider_name)
+            provider.validate_model_id(model_id)
 
         # Get API key for the provider
         api_key = settings.get_api_key(provider_name)
@@ -55,18 +68,35 @@ class ProviderFactory:
                 f"Please set the appropriate environment variable in .env"
             )
 
+        # Reuse an existing client for identical configuration. The API
+        # key is part of the key so a credential rotation at runtime
+        # yields a fresh client instead of one bound to the old key.
+        cache_key = (
+            provider_name,
+            model_id,
+            api_key,
+            temperature,
+            tuple(sorted((k, repr(v)) for k, v in kwargs.items()))
+        )
+        llm = ProviderFactory._llm_cache.get(cache_key)
+        if llm is not None:
+            return llm
+
         # Get base URL if applicable (for OpenAI-compatible providers)
         base_url = settings.get_base_url(provider_name)
         if base_url:
             kwargs["base_url"] = base_url
 
-        # Initialize and return the LLM
-        return provider.initialize(
+        # Initialize, cache, and return the LLM
+        llm = provider.initialize(
             model_id=model_id,
             api_key=api_key,
             temperature=temperature,
             **kwargs
         )
+        with ProviderFactory._llm_cache_lock:
+            ProviderFactory._llm_cache.setdefault(cache_key, llm)
+        return ProviderFactory._llm_cache[cache_key]
 
     @staticmethod
     def get_provider_info(provider_name: str) -> dict:
@@ -87,14 +117,21 @@ class ProviderFactory:
             "supports_streaming": provider.supports_streaming()
         }
 
+    # Cached flat model tuple and its serialized /models payload. The model
+    # tables are static per process, so this is built once and only rebuilt
+    # if a plugin registers a new provider.
+    _all_models_cache: Optional[tuple] = None
+    _all_models_json: Optional[bytes] = None
+    _all_models_version: int = -1
+
     @staticmethod
-    def list_all_models() -> list:
+    def list_all_models() -> tuple:
         """
-        Get a flat list of all available models across all providers.
+        Get a flat tuple of all available models across all providers.
 
         Returns:
-            List of dicts with model info including provider information
-            Example: [
+            Tuple of dicts with model info including provider information
+            Example: (
                 {
                     "provider": "mistral",
                     "provider_name": "Mistral AI",
@@ -104,18 +141,21 @@ class ProviderFactory:
                     "supports_thinking": false
                 },
                 ...
-            ]
+            )
         """
-        result = []
-        all_models = ProviderRegistry.get_all_models()
+        version = ProviderRegistry.registry_version()
+        if ProviderFactory._all_models_version == version:
+            return ProviderFactory._all_models_cache
 
-        for provider_id, models in all_models.items():
+        result = []
+        for provider_id in ProviderRegistry.list_providers():
             provider = ProviderRegistry.get_provider(provider_id)
-            for model in models:
+            provider_name = provider.get_provider_name()
+            for model in provider.get_available_models():
                 model_id = model["id"]
                 result.append({
                     "provider": provider_id,
-                    "provider_name": provider.get_provider_name(),
+                    "provider_name": provider_name,
                     "model_id": model_id,
                     "model_name": model["name"],
                     "description": model["description"],
@@ -123,4 +163,20 @@ class ProviderFactory:
                     "thinking_locked": provider.is_thinking_locked(model_id)
                 })
 
-        return result
+        ProviderFactory._all_models_cache = tuple(result)
+        ProviderFactory._all_models_json = orjson.dumps(
+            {"models": result, "count": len(result)}
+        )
+        ProviderFactory._all_models_version = version
+        return ProviderFactory._all_models_cache
+
+    @staticmethod
+    def list_all_models_json() -> bytes:
+        """
+        Get the serialized /models payload ({"models": [...], "count": N}).
+
+        Returns:
+            Pre-encoded JSON bytes, rebuilt only when the registry changes
+        """
+        ProviderFactory.list_all_models()
+        return ProviderFactory._all_models_json
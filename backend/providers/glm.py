@@ -2,71 +2,44 @@
 Zhipu AI GLM provider implementation.
 """
 
-from typing import List, Dict
-from langchain_openai import ChatOpenAI
-from .base import BaseLLMProvider
-
-
-class GLMProvider(BaseLLMProvider):
+from typing import Dict, Tuple
+from .openai_compatible import OpenAICompatibleProvider
+
+
+_MODELS: Tuple[Dict[str, str], ...] = (
+    {
+        "id": "glm-4.7",
+        "name": "GLM 4.7",
+        "description": "Enhanced GLM-4 with improved capabilities",
+        "supports_thinking": True,
+        "thinking_locked": False
+    },
+    {
+        "id": "glm-4.6",
+        "name": "GLM 4.6",
+        "description": "Balanced performance and efficiency",
+        "supports_thinking": True,
+        "thinking_locked": False
+    },
+)
+
+# extra_body payloads are constant per thinking mode, shared across calls
+_EXTRA_BODY_THINKING = {}
+_EXTRA_BODY_DEFAULT = {"thinking": {"type": "disabled"}}
+
+
+class GLMProvider(OpenAICompatibleProvider):
     """Zhipu AI GLM provider using OpenAI-compatible API."""
 
-    def get_available_models(self) -> List[Dict[str, str]]:
-        """Return available GLM models."""
-        return [
-            {
-                "id": "glm-4.7",
-                "name": "GLM 4.7",
-                "description": "Enhanced GLM-4 with improved capabilities",
-                "supports_thinking": True,
-                "thinking_locked": False
-            },
-            {
-                "id": "glm-4.6",
-                "name": "GLM 4.6",
-                "description": "Balanced performance and efficiency",
-                "supports_thinking": True,
-                "thinking_locked": False
-            },
-        ]
-
-    def get_provider_name(self) -> str:
-        """Return the provider name."""
-        return "Zhipu AI GLM"
-
-    def supports_streaming(self) -> bool:
-        """GLM supports streaming."""
-        return True
+    __slots__ = ()
 
-    def initialize(self, model_id: str, api_key: str, temperature: float = 0.7, thinking: bool = False, **kwargs):
-        """
-        Initialize GLM LLM client.
+    PROVIDER_NAME = "Zhipu AI GLM"
+    DEFAULT_BASE_URL = "https://open.bigmodel.cn/api/paas/v4"
 
-        Args:
-            model_id: GLM model ID (e.g., 'glm-4-plus')
-            api_key: Zhipu AI API key
-            temperature: Sampling temperature (default: 0.7)
-            thinking: Enable thinking mode (default: False)
-            **kwargs: Additional configuration (e.g., base_url)
-
-        Returns:
-            ChatOpenAI instance configured for GLM
-        """
-        validated_key = self.validate_api_key(api_key)
-        validated_model = self.validate_model_id(model_id)
-
-        base_url = kwargs.get("base_url", "https://open.bigmodel.cn/api/paas/v4")
-
-        # Build extra_body for thinking mode
-        # By default the thinking is enabled, GLM-4.6 will decide if thinking is necessary
-        extra_body = {}
-        if not thinking:
-            extra_body["thinking"] = {'type': 'disabled'}
+    def get_available_models(self) -> Tuple[Dict[str, str], ...]:
+        """Return available GLM models."""
+        return _MODELS
 
-        return ChatOpenAI(
-            model=validated_model,
-            api_key=validated_key,
-            base_url=base_url,
-            temperature=temperature,
-            streaming=True,
-            extra_body=extra_body
-        )
+    def _build_extra_body(self, model_id: str, thinking: bool) -> Dict:
+        """GLM thinks by default; disable it explicitly when not requested."""
+        return _EXTRA_BODY_THINKING if thinking else _EXTRA_BODY_DEFAULT
@@ -2,65 +2,37 @@
 MiniMax provider implementation.
 """
 
-from typing import List, Dict
-from langchain_openai import ChatOpenAI
-from .base import BaseLLMProvider
+from typing import Dict, Tuple
+from .openai_compatible import OpenAICompatibleProvider
 
 
-class MiniMaxProvider(BaseLLMProvider):
-    """MiniMax provider using OpenAI-compatible API."""
-
-    def get_available_models(self) -> List[Dict[str, str]]:
-        """Return available MiniMax models."""
-        return [
-            {
-                "id": "MiniMax-M2.1",
-                "name": "MiniMax-M2.1",
-                "description": "Latest generation model with superior performance",
-                "supports_thinking": True,
-                "thinking_locked": True
-            },
-        ]
+_MODELS: Tuple[Dict[str, str], ...] = (
+    {
+        "id": "MiniMax-M2.1",
+        "name": "MiniMax-M2.1",
+        "description": "Latest generation model with superior performance",
+        "supports_thinking": True,
+        "thinking_locked": True
+    },
+)
 
-    def get_provider_name(self) -> str:
-        """Return the provider name."""
-        return "MiniMax"
+# extra_body payloads are constant per thinking mode, shared across calls
+_EXTRA_BODY_THINKING = {"enable_thinking": True}
+_EXTRA_BODY_DEFAULT = {"enable_thinking": False}
 
-    def supports_streaming(self) -> bool:
-        """MiniMax supports streaming."""
-        return True
 
-    def initialize(self, model_id: str, api_key: str, temperature: float = 0.7, thinking: bool = False, **kwargs):
-        """
-        Initialize MiniMax LLM client.
-
-        Args:
-            model_id: MiniMax model ID (e.g., 'MiniMax-M2.1')
-            api_key: MiniMax API key
-            temperature: Sampling temperature (default: 0.7)
-            thinking: Enable thinking mode (default: False)
-            **kwargs: Additional configuration (e.g., base_url)
+class MiniMaxProvider(OpenAICompatibleProvider):
+    """MiniMax provider using OpenAI-compatible API."""
 
-        Returns:
-            ChatOpenAI instance configured for MiniMax
-        """
-        validated_key = self.validate_api_key(api_key)
-        validated_model = self.validate_model_id(model_id)
+    __slots__ = ()
 
-        base_url = kwargs.get("base_url", "https://api.minimax.chat/v1")
+    PROVIDER_NAME = "MiniMax"
+    DEFAULT_BASE_URL = "https://api.minimax.chat/v1"
 
-        # Build extra_body for thinking mode
-        extra_body = {}
-        if thinking:
-            extra_body["enable_thinking"] = True
-        else:
-            extra_body["enable_thinking"] = False
+    def get_available_models(self) -> Tuple[Dict[str, str], ...]:
+        """Return available MiniMax models."""
+        return _MODELS
 
-        return ChatOpenAI(
-            model=validated_model,
-            api_key=validated_key,
-            base_url=base_url,
-            temperature=temperature,
-            streaming=True,
-            extra_body=extra_body
-        )
+    def _build_extra_body(self, model_id: str, thinking: bool) -> Dict:
+        """MiniMax expects an explicit enable_thinking flag either way."""
+        return _EXTRA_BODY_THINKING if thinking else _EXTRA_BODY_DEFAULT
@@ -2,51 +2,55 @@
 Mistral AI provider implementation.
 """
 
-from typing import List, Dict
-from langchain_mistralai import ChatMistralAI
+from typing import Dict, Tuple
 from .base import BaseLLMProvider
 
 
+_MODELS: Tuple[Dict[str, str], ...] = (
+    {
+        "id": "mistral-large-latest",
+        "name": "Mistral Large",
+        "description": "Most capable Mistral model for complex tasks",
+        "supports_thinking": False
+    },
+    {
+        "id": "mistral-medium-latest",
+        "name": "Mistral Medium",
+        "description": "Balanced performance and cost",
+        "supports_thinking": False
+    },
+    {
+        "id": "mistral-small-latest",
+        "name": "Mistral Small",
+        "description": "Low cost and performance",
+        "supports_thinking": False
+    },
+    {
+        "id": "magistral-medium-latest",
+        "name": "Magistral Medium",
+        "description": "Frontier-class multi-modal reasoning model",
+        "supports_thinking": True,
+        "thinking_locked": True,
+    },
+    {
+        "id": "magistral-small-latest",
+        "name": "Magistral Small",
+        "description": "Small multi-modal reasoning model",
+        "supports_thinking": True,
+        "thinking_locked": True,
+    },
+
+)
+
+
 class MistralProvider(BaseLLMProvider):
     """Mistral AI provider using native ChatMistralAI."""
 
-    def get_available_models(self) -> List[Dict[str, str]]:
+    __slots__ = ()
+
+    def get_available_models(self) -> Tuple[Dict[str, str], ...]:
         """Return available Mistral models."""
-        return [
-            {
-                "id": "mistral-large-latest",
-                "name": "Mistral Large",
-                "description": "Most capable Mistral model for complex tasks",
-                "supports_thinking": False
-            },
-            {
-                "id": "mistral-medium-latest",
-                "name": "Mistral Medium",
-                "description": "Balanced performance and cost",
-                "supports_thinking": False
-            },
-            {
-                "id": "mistral-small-latest",
-                "name": "Mistral Small",
-                "description": "Low cost and performance",
-                "supports_thinking": False
-            },
-            {
-                "id": "magistral-medium-latest",
-                "name": "Magistral Medium",
-                "description": "Frontier-class multi-modal reasoning model",
-                "supports_thinking": True,
-                "thinking_locked": True,
-            },
-            {
-                "id": "magistral-small-latest",
-                "name": "Magistral Small",
-                "description": "Small multi-modal reasoning model",
-                "supports_thinking": True,
-                "thinking_locked": True,
-            },
-
-        ]
+        return _MODELS
 
     def get_provider_name(self) -> str:
         """Return the provider name."""
@@ -70,15 +74,15 @@ class MistralProvider(BaseLLMProvider):
         Returns:
             ChatMistralAI instance
         """
-        validated_key = self.validate_api_key(api_key)
-        validated_model = self.validate_model_id(model_id)
+        from langchain_mistralai import ChatMistralAI
+
 
         # thinking parameter ignored - not supported
         _ = thinking
 
         return ChatMistralAI(
-            model=validated_model,
-            api_key=validated_key,
+            model=model_id,
+            api_key=api_key,
             temperature=temperature,
             streaming=True
         )
@@ -2,66 +2,43 @@
 OpenAI GPT provider implementation.
 """
 
-from typing import List, Dict
-from langchain_openai import ChatOpenAI
-from .base import BaseLLMProvider
+from typing import Dict, Tuple
+from .openai_compatible import OpenAICompatibleProvider
 
 
-class OpenAIProvider(BaseLLMProvider):
-    """OpenAI GPT provider using OpenAI API."""
+_MODELS: Tuple[Dict[str, str], ...] = (
+    {
+        "id": "gpt-5.2",
+        "name": "GPT-5.2",
+        "description": "Most capable GPT-5 model",
+        "support_thinking": False
+    },
+    {
+        "id": "gpt-5.2-chat",
+        "name": "GPT-5.2 Chat",
+        "description": "Most capable GPT-5 chat/instruct model",
+        "support_thinking": False
+    },
+)
 
-    def get_available_models(self) -> List[Dict[str, str]]:
-        """Return available OpenAI models."""
-        return [
-            {
-                "id": "gpt-5.2",
-                "name": "GPT-5.2",
-                "description": "Most capable GPT-5 model",
-                "support_thinking": False
-            },
-            {
-                "id": "gpt-5.2-chat",
-                "name": "GPT-5.2 Chat",
-                "description": "Most capable GPT-5 chat/instruct model",
-                "support_thinking": False
-            },
-        ]
-
-    def get_provider_name(self) -> str:
-        """Return the provider name."""
-        return "OpenAI"
-
-    def supports_streaming(self) -> bool:
-        """OpenAI supports streaming."""
-        return True
 
-    def initialize(self, model_id: str, api_key: str, temperature: float = 0.7, thinking: bool = False, **kwargs):
-        """
-        Initialize OpenAI LLM client.
+class OpenAIProvider(OpenAICompatibleProvider):
+    """OpenAI provider."""
 
-        Args:
-            model_id: OpenAI model ID (e.g., 'gpt-5.2')
-            api_key: OpenAI API key
-            temperature: Sampling temperature (default: 0.7)
-            thinking: Not supported for this model
-            **kwargs: Additional configuration (e.g., base_url)
+    __slots__ = ()
 
-        Returns:
-            ChatOpenAI instance configured for OpenAI
-        """
-        validated_key = self.validate_api_key(api_key)
-        validated_model = self.validate_model_id(model_id)
+    PROVIDER_NAME = "OpenAI"
+    DEFAULT_BASE_URL = "https://api.openai.com/v1"
 
-        base_url = kwargs.get("base_url", "https://api.openai.com/v1")
+    def get_available_models(self) -> Tuple[Dict[str, str], ...]:
+        """Return available OpenAI models."""
+        return _MODELS
 
-        # thinking parameter ignored - not supported
-        _ = thinking
+    def supports_json_mode(self, model_id: str) -> bool:
+        """OpenAI models support guaranteed JSON output via response_format."""
+        _ = model_id
+        return True
 
-        return ChatOpenAI(
-            model=validated_model,
-            api_key=validated_key,
-            base_url=base_url,
-            temperature=temperature,
-            streaming=True,
-            default_headers={"User-Agent": self.get_user_agent()}
-        )
+    def _customize_client_kwargs(self, client_kwargs: Dict, model_id: str, thinking: bool):
+        """Send a standard User-Agent; thinking is not supported."""
+        client_kwargs["default_headers"] = {"User-Agent": self.get_user_agent()}
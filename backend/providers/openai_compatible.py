@@ -0,0 +1,84 @@
+"""
+Shared base class for providers speaking the OpenAI chat completions API.
+"""
+
+from typing import Dict, Optional
+
+from .base import BaseLLMProvider, get_shared_async_client
+
+
+class OpenAICompatibleProvider(BaseLLMProvider):
+    """
+    Base class for OpenAI-compatible providers.
+
+    Most providers in this package differ only in their base URL, model
+    table, display name, and a couple of request knobs (thinking flags,
+    reasoning effort). Subclasses declare PROVIDER_NAME and
+    DEFAULT_BASE_URL, supply the model table, and override the two
+    hooks below for provider-specific behavior; the ChatOpenAI
+    construction lives here once.
+    """
+
+    __slots__ = ()
+
+    PROVIDER_NAME: str = ""
+    DEFAULT_BASE_URL: str = ""
+
+    def get_provider_name(self) -> str:
+        """Return the provider name."""
+        return self.PROVIDER_NAME
+
+    def supports_streaming(self) -> bool:
+        """All OpenAI-compatible providers support streaming."""
+        return True
+
+    def _build_extra_body(self, model_id: str, thinking: bool) -> Optional[Dict]:
+        """
+        Build the extra_body payload for provider-specific request fields
+        (e.g. thinking flags). Return None to omit extra_body entirely.
+        """
+        return None
+
+    def _customize_client_kwargs(self, client_kwargs: Dict, model_id: str, thinking: bool):
+        """
+        Adjust the ChatOpenAI keyword arguments in place before the
+        client is constructed (add headers, drop unsupported params).
+        """
+
+    def initialize(self, model_id: str, api_key: str, temperature: float = 0.7, thinking: bool = False, **kwargs):
+        """
+        Initialize an OpenAI-compatible LLM client.
+
+        Args:
+            model_id: Model ID to use
+            api_key: Provider API key
+            temperature: Sampling temperature (default: 0.7)
+            thinking: Enable thinking mode where the provider supports it
+            **kwargs: Additional configuration (e.g., base_url, response_format)
+
+        Returns:
+            ChatOpenAI instance configured for this provider
+        """
+        from langchain_openai import ChatOpenAI
+
+        client_kwargs = {
+            "model": model_id,
+            "api_key": api_key,
+            "base_url": kwargs.get("base_url", self.DEFAULT_BASE_URL),
+            "temperature": temperature,
+            "streaming": True,
+            "http_async_client": get_shared_async_client(),
+        }
+
+        extra_body = self._build_extra_body(model_id, thinking)
+        if extra_body is not None:
+            client_kwargs["extra_body"] = extra_body
+
+        # Forward response_format (e.g., JSON mode) when requested
+        if kwargs.get("response_format") and self.supports_json_mode(model_id):
+            client_kwargs["model_kwargs"] = {
+                "response_format": kwargs["response_format"]
+            }
+
+        self._customize_client_kwargs(client_kwargs, model_id, thinking)
+        return ChatOpenAI(**client_kwargs)
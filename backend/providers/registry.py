@@ -2,31 +2,56 @@
 Provider registry for managing available LLM providers.
 """
 
-from typing import Dict, List, Type
+import importlib
+from typing import Dict, List, Tuple, Type
 from .base import BaseLLMProvider
-from .mistral import MistralProvider
-from .qwen import QwenProvider
-from .glm import GLMProvider
-from .minimax import MiniMaxProvider
-from .deepseek import DeepSeekProvider
-from .openai import OpenAIProvider
-from .gemini import GeminiProvider
 
 
 class ProviderRegistry:
     """Registry for all available LLM providers."""
 
-    # Registry of provider name to provider class
-    _providers: Dict[str, Type[BaseLLMProvider]] = {
-        "mistral": MistralProvider,
-        "qwen": QwenProvider,
-        "glm": GLMProvider,
-        "minimax": MiniMaxProvider,
-        "deepseek": DeepSeekProvider,
-        "openai": OpenAIProvider,
-        "gemini": GeminiProvider,
+    # Built-in providers, loaded on first use. Each entry maps a provider
+    # name to the class exported by the sibling module of the same name;
+    # deferring the import keeps package import time independent of how
+    # many providers exist.
+    _provider_modules: Dict[str, str] = {
+        "mistral": "MistralProvider",
+        "qwen": "QwenProvider",
+        "glm": "GLMProvider",
+        "minimax": "MiniMaxProvider",
+        "deepseek": "DeepSeekProvider",
+        "openai": "OpenAIProvider",
+        "gemini": "GeminiProvider",
     }
 
+    # Provider classes that have been loaded or registered explicitly
+    _providers: Dict[str, Type[BaseLLMProvider]] = {}
+
+    # Providers are stateless, so one instance per name is shared by
+    # every caller instead of constructing a fresh object per lookup
+    _instances: Dict[str, BaseLLMProvider] = {}
+
+    # Bumped whenever the registry changes so caches derived from the
+    # provider set (e.g. the flat model list) know when to rebuild.
+    _registry_version: int = 0
+
+    # model id -> provider name, built lazily from the registered
+    # providers and rebuilt when the registry version changes
+    _model_index: Dict[str, str] = {}
+    _model_index_version: int = -1
+
+    # Cached provider-name tuple and its ", "-joined form for error
+    # messages, rebuilt when the registry changes
+    _provider_names: Tuple[str, ...] = ()
+    _provider_names_version: int = -1
+    _providers_str: str = ""
+    _providers_str_version: int = -1
+
+    @classmethod
+    def registry_version(cls) -> int:
+        """Return a counter that changes whenever providers are (un)registered."""
+        return cls._registry_version
+
     @classmethod
     def get_provider(cls, provider_name: str) -> BaseLLMProvider:
         """
@@ -41,42 +66,75 @@ class ProviderRegistry:
         Raises:
             ValueError: If provider_name is not registered
         """
-        if provider_name not in cls._providers:
-            raise ValueError(
-                f"Unknown provider: {provider_name}. "
-                f"Available providers: {', '.join(cls.list_providers())}"
-            )
-        return cls._providers[provider_name]()
+        instance = cls._instances.get(provider_name)
+        if instance is not None:
+            return instance
+
+        provider_class = cls._providers.get(provider_name)
+        if provider_class is None:
+            if provider_name not in cls._provider_modules:
+                raise ValueError(
+                    f"Unknown provider: {provider_name}. "
+                    f"Available providers: {cls._joined_provider_names()}"
+                )
+            module = importlib.import_module(f".{provider_name}", __package__)
+            provider_class = getattr(module, cls._provider_modules[provider_name])
+            cls._providers[provider_name] = provider_class
+
+        instance = provider_class()
+        cls._instances[provider_name] = instance
+        return instance
 
     @classmethod
-    def list_providers(cls) -> List[str]:
+    def list_providers(cls) -> Tuple[str, ...]:
         """
         List all registered provider names.
 
         Returns:
-            List of provider names
+            Tuple of provider names
         """
-        return list(cls._providers.keys())
+        if cls._provider_names_version != cls._registry_version:
+            cls._provider_names = tuple({**cls._provider_modules, **cls._providers})
+            cls._provider_names_version = cls._registry_version
+        return cls._provider_names
+
+    @classmethod
+    def _joined_provider_names(cls) -> str:
+        """Return the provider names joined for error messages."""
+        if cls._providers_str_version != cls._registry_version:
+            cls._providers_str = ", ".join(cls.list_providers())
+            cls._providers_str_version = cls._registry_version
+        return cls._providers_str
+
+    # Cached grouped-models dict, rebuilt when the registry changes
+    _all_models_cache: Dict[str, Tuple[Dict[str, str], ...]] = {}
+    _all_models_version: int = -1
 
     @classmethod
-    def get_all_models(cls) -> Dict[str, List[Dict[str, str]]]:
+    def get_all_models(cls) -> Dict[str, Tuple[Dict[str, str], ...]]:
         """
         Get all available models grouped by provider.
 
+        The model tables are static per process, so the grouped dict is
+        built once and reused until a new provider is registered.
+
         Returns:
             Dict mapping provider names to their available models
             Example: {
-                "mistral": [
+                "mistral": (
                     {"id": "mistral-large-latest", "name": "Mistral Large", ...},
                     ...
-                ]
+                )
             }
         """
-        result = {}
-        for provider_name in cls.list_providers():
-            provider = cls.get_provider(provider_name)
-            result[provider_name] = provider.get_available_models()
-        return result
+        if cls._all_models_version != cls._registry_version:
+            result = {}
+            for provider_name in cls.list_providers():
+                provider = cls.get_provider(provider_name)
+                result[provider_name] = provider.get_available_models()
+            cls._all_models_cache = result
+            cls._all_models_version = cls._registry_version
+        return cls._all_models_cache
 
     @classmethod
     def register_provider(cls, name: str, provider_class: Type[BaseLLMProvider]):
@@ -90,6 +148,8 @@ class ProviderRegistry:
         if not issubclass(provider_class, BaseLLMProvider):
             raise TypeError(f"{provider_class} must inherit from BaseLLMProvider")
         cls._providers[name] = provider_class
+        cls._instances.pop(name, None)
+        cls._registry_version += 1
 
     @classmethod
     def find_provider_for_model(cls, model_id: str) -> tuple[str, BaseLLMProvider]:
@@ -105,13 +165,21 @@ class ProviderRegistry:
         Raises:
             ValueError: If model_id is not found in any provider
         """
-        for provider_name in cls.list_providers():
-            provider = cls.get_provider(provider_name)
-            model_ids = [m["id"] for m in provider.get_available_models()]
-            if model_id in model_ids:
-                return provider_name, provider
-
-        raise ValueError(
-            f"Model '{model_id}' not found in any registered provider. "
-            f"Use get_all_models() to see available models."
-        )
+        if cls._model_index_version != cls._registry_version:
+            # setdefault keeps the first provider that claims a model id,
+            # matching the scan order of the old linear search
+            index: Dict[str, str] = {}
+            for provider_name in cls.list_providers():
+                provider = cls.get_provider(provider_name)
+                for model in provider.get_available_models():
+                    index.setdefault(model["id"], provider_name)
+            cls._model_index = index
+            cls._model_index_version = cls._registry_version
+
+        provider_name = cls._model_index.get(model_id)
+        if provider_name is None:
+            raise ValueError(
+                f"Model '{model_id}' not found in any registered provider. "
+                f"Use get_all_models() to see available models."
+            )
+        return provider_name, cls.get_provider(provider_name)
@@ -2,14 +2,66 @@
 Base storage interface for conversation persistence.
 """
 
+import time
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 from datetime import datetime
 
+# now_iso() result cached at ~1 ms granularity; storage timestamps don't
+# need finer resolution and mutations cluster within a request
+_now_cache_at = 0.0
+_now_cache_iso = ""
+
+
+def now_iso() -> str:
+    """
+    Current local time as an ISO-8601 string.
+
+    datetime.now().isoformat() costs a tz lookup plus string formatting
+    and is called several times per storage mutation; the result is
+    cached for a millisecond so bursts share one formatted value.
+    """
+    global _now_cache_at, _now_cache_iso
+    t = time.monotonic()
+    if t - _now_cache_at >= 0.001:
+        _now_cache_at = t
+        _now_cache_iso = datetime.now().isoformat()
+    return _now_cache_iso
+
+
+def now_ms() -> int:
+    """Current time as integer epoch milliseconds."""
+    return time.time_ns() // 1_000_000
+
+
+def ms_to_iso(value) -> str:
+    """Format an epoch-ms timestamp as ISO-8601; legacy strings pass through."""
+    if isinstance(value, str):
+        return value
+    return datetime.fromtimestamp(value / 1000).isoformat(timespec="milliseconds")
+
+
+def iso_to_ms(value) -> int:
+    """Parse an ISO-8601 timestamp back to epoch ms; ints pass through."""
+    if isinstance(value, str):
+        return round(datetime.fromisoformat(value).timestamp() * 1000)
+    return value
+
 
 class ConversationStorage(ABC):
     """Abstract base class for conversation storage backends."""
 
+    # Empty slots so backends that declare __slots__ actually drop their
+    # per-instance __dict__ (same pattern as BaseLLMProvider)
+    __slots__ = ()
+
+    async def close(self) -> None:
+        """Release resources held by the backend.
+
+        Backends with buffered writes flush them here; the default is a
+        no-op for backends with nothing to release.
+        """
+
     @abstractmethod
     async def get_conversation(self, conversation_id: str) -> Optional[Dict]:
         """
@@ -112,14 +164,21 @@ class ConversationStorage(ABC):
     async def list_conversations(
         self,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after_updated_at: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict]:
         """
-        List all conversations.
+        List all conversations, most recently updated first.
 
         Args:
             limit: Maximum number of conversations to return
             offset: Number of conversations to skip
+            after_updated_at: Keyset cursor — return conversations
+                strictly older than this updated_at (paired with
+                after_id for tie-breaking). Preferred over offset for
+                deep pagination.
+            after_id: Keyset cursor companion to after_updated_at
 
         Returns:
             List of conversation metadata dicts
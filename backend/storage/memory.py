@@ -2,26 +2,50 @@
 In-memory storage implementation for conversations.
 """
 
+from itertools import islice
 from typing import List, Dict, Optional
-from datetime import datetime
-from .base import ConversationStorage
+from .base import ConversationStorage, now_iso
 
 
 class MemoryStorage(ConversationStorage):
-    """In-memory storage backend (current implementation)."""
+    """In-memory storage backend (current implementation).
+
+    The conversations dict is kept in recency order (most recently
+    updated last) by re-inserting an entry whenever it is touched, so
+    listing by recency is a reversed iteration instead of a full sort.
+
+    Messages live inside each conversation dict under the "_messages"
+    key, so the hot add_message path resolves one dict entry instead of
+    probing two parallel dicts. Accessors that hand conversation dicts
+    to callers project the internal key away.
+    """
+
+    __slots__ = ("_conversations",)
 
     def __init__(self):
         """Initialize in-memory storage."""
         self._conversations: Dict[str, Dict] = {}
-        self._messages: Dict[str, List[Dict]] = {}
+
+    def _touch(self, conversation_id: str) -> None:
+        """Move a conversation to the most-recent end of the dict."""
+        self._conversations[conversation_id] = self._conversations.pop(conversation_id)
+
+    @staticmethod
+    def _public_view(conv: Dict) -> Dict:
+        """Return a conversation dict without the internal message list."""
+        return {k: v for k, v in conv.items() if k != "_messages"}
 
     async def get_conversation(self, conversation_id: str) -> Optional[Dict]:
         """Get conversation metadata."""
-        return self._conversations.get(conversation_id)
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
+            return None
+        return self._public_view(conv)
 
     async def get_messages(self, conversation_id: str) -> List[Dict]:
         """Get all messages in a conversation."""
-        return self._messages.get(conversation_id, [])
+        conv = self._conversations.get(conversation_id)
+        return conv["_messages"] if conv is not None else []
 
     async def add_message(
         self,
@@ -35,17 +59,15 @@ class MemoryStorage(ConversationStorage):
     ) -> None:
         """Add a message to a conversation."""
         # Create conversation if it doesn't exist
-        if conversation_id not in self._conversations:
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
             await self.create_conversation(conversation_id, model or "unknown")
-
-        # Add message
-        if conversation_id not in self._messages:
-            self._messages[conversation_id] = []
+            conv = self._conversations[conversation_id]
 
         message = {
             "role": role,
             "content": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         if model and role == "assistant":
             message["model"] = model
@@ -56,11 +78,13 @@ class MemoryStorage(ConversationStorage):
         if metadata:
             message["metadata"] = metadata
 
-        self._messages[conversation_id].append(message)
+        messages = conv["_messages"]
+        messages.append(message)
 
         # Update conversation metadata
-        self._conversations[conversation_id]["updated_at"] = datetime.now().isoformat()
-        self._conversations[conversation_id]["message_count"] = len(self._messages[conversation_id])
+        conv["updated_at"] = now_iso()
+        conv["message_count"] = len(messages)
+        self._touch(conversation_id)
 
     async def create_conversation(
         self,
@@ -78,35 +102,38 @@ class MemoryStorage(ConversationStorage):
             "id": conversation_id,
             "model": model,
             "mode": mode,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat(),
+            "created_at": now_iso(),
+            "updated_at": now_iso(),
             "message_count": 0,
             "metadata": metadata or {},
-            "title": title or "New Conversation"
+            "title": title or "New Conversation",
+            "_messages": []
         }
-        self._messages[conversation_id] = []
 
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation and all its messages."""
-        if conversation_id not in self._conversations:
-            return False
-
-        del self._conversations[conversation_id]
-        if conversation_id in self._messages:
-            del self._messages[conversation_id]
-
-        return True
+        return self._conversations.pop(conversation_id, None) is not None
 
     async def list_conversations(
         self,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after_updated_at: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict]:
-        """List all conversations."""
-        conversations = list(self._conversations.values())
-        # Sort by updated_at descending (most recent first)
-        conversations.sort(key=lambda x: x["updated_at"], reverse=True)
-        return conversations[offset:offset + limit]
+        """List all conversations, most recently updated first."""
+        # Most recent first; the dict is already in recency order
+        conversations = reversed(self._conversations.values())
+        if after_updated_at is not None and after_id is not None:
+            cursor = (after_updated_at, after_id)
+            conversations = (
+                conv for conv in conversations
+                if (conv["updated_at"], conv["id"]) < cursor
+            )
+        return [
+            self._public_view(conv)
+            for conv in islice(conversations, offset, offset + limit)
+        ]
 
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if a conversation exists."""
@@ -118,24 +145,41 @@ class MemoryStorage(ConversationStorage):
         title: str
     ) -> bool:
         """Update the title of a conversation."""
-        if conversation_id not in self._conversations:
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
             return False
 
-        self._conversations[conversation_id]["title"] = title
-        self._conversations[conversation_id]["updated_at"] = datetime.now().isoformat()
+        conv["title"] = title
+        conv["updated_at"] = now_iso()
+        self._touch(conversation_id)
         return True
 
     async def delete_all_conversations(self) -> int:
         """Delete all conversations and their messages."""
         count = len(self._conversations)
         self._conversations.clear()
-        self._messages.clear()
         return count
 
     def clear_all(self) -> None:
         """Clear all conversations (useful for testing)."""
         self._conversations.clear()
-        self._messages.clear()
+
+    @staticmethod
+    def _merge_metadata(old: Dict, new: Dict) -> Dict:
+        """RFC 7386-style merge, matching sqlite's json_patch.
+
+        Dict values merge recursively and a None value deletes its key,
+        so both backends produce the same metadata for the same calls.
+        """
+        merged = dict(old)
+        for key, value in new.items():
+            if value is None:
+                merged.pop(key, None)
+            elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = MemoryStorage._merge_metadata(merged[key], value)
+            else:
+                merged[key] = value
+        return merged
 
     async def update_conversation_metadata(
         self,
@@ -143,19 +187,19 @@ class MemoryStorage(ConversationStorage):
         metadata: Dict
     ) -> bool:
         """Update conversation metadata."""
-        if conversation_id not in self._conversations:
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
             return False
 
         # Extract mode if present in metadata
         mode = metadata.pop("mode", None)
         if mode:
-            self._conversations[conversation_id]["mode"] = mode
+            conv["mode"] = mode
 
         # Merge metadata
-        existing_metadata = self._conversations[conversation_id].get("metadata", {})
-        merged_metadata = {**existing_metadata, **metadata}
-        self._conversations[conversation_id]["metadata"] = merged_metadata
-        self._conversations[conversation_id]["updated_at"] = datetime.now().isoformat()
+        conv["metadata"] = self._merge_metadata(conv.get("metadata", {}), metadata)
+        conv["updated_at"] = now_iso()
+        self._touch(conversation_id)
         return True
 
     async def update_debate_state(
@@ -171,7 +215,8 @@ class MemoryStorage(ConversationStorage):
 
     async def get_debate_state(self, conversation_id: str) -> Optional[Dict]:
         """Get debate state from conversation metadata."""
-        if conversation_id not in self._conversations:
+        conv = self._conversations.get(conversation_id)
+        if conv is None:
             return None
 
-        return self._conversations[conversation_id].get("metadata", {}).get("debate_state")
+        return conv.get("metadata", {}).get("debate_state")
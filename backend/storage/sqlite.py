@@ -8,21 +8,48 @@ This module provides persistent storage using SQLite with support for:
 - Message history with metadata
 """
 
-import json
+import asyncio
 import sqlite3
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime
+import time
+
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import aiosqlite
 
-from .base import ConversationStorage
+from .base import ConversationStorage, now_ms, ms_to_iso, iso_to_ms
 
 logger = logging.getLogger(__name__)
 
 
 class SQLiteStorage(ConversationStorage):
-    """SQLite-based persistent storage backend."""
+    """SQLite-based persistent storage backend.
+
+    Message inserts are write-behind: add_message appends to an
+    in-memory buffer that is flushed to SQLite in a single transaction
+    once it fills up or before any read that could observe the pending
+    rows. This coalesces commits (and their fsyncs) under load at the
+    cost of buffered messages being lost if the process dies before a
+    flush.
+    """
+
+    # Pending messages are flushed once the buffer reaches this size
+    _PENDING_FLUSH_THRESHOLD = 32
+
+    # conversation_exists results are remembered per process; entries
+    # expire after the TTL in case another process touches the database
+    _EXISTS_CACHE_SIZE = 4096
+    _EXISTS_CACHE_TTL = 30.0
+
+    # Decoded message histories kept per conversation, in LRU order
+    _MSG_CACHE_SIZE = 256
+
+    # Read connections kept in a pool; WAL lets them run concurrently
+    # with each other and with the single writer
+    _READ_POOL_SIZE = 4
 
     def __init__(self, database_path: str = "conversations.db"):
         """
@@ -33,128 +60,278 @@ class SQLiteStorage(ConversationStorage):
         """
         self.database_path = database_path
         self._initialized = False
+        self._conn: Optional[aiosqlite.Connection] = None
+        self._read_pool: Optional[asyncio.Queue] = None
+        self._init_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._pending: List[Tuple] = []
+        # conversation id -> (exists, cached-at), in LRU order
+        self._exists_cache: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+        # conversation id -> decoded message list; write-through, so a
+        # hit also covers rows still sitting in the pending buffer
+        self._msg_cache: "OrderedDict[str, List[Dict]]" = OrderedDict()
 
     async def _init_db(self):
         """Initialize database schema if needed."""
         if self._initialized:
             return
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await self._init_db_locked()
+
+    async def _init_db_locked(self):
 
         # Ensure parent directory exists
         db_path = Path(self.database_path)
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        async with aiosqlite.connect(self.database_path) as db:
-            # Enable foreign keys
-            await db.execute("PRAGMA foreign_keys = ON")
-
-            # Create conversations table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS conversations (
-                    id TEXT PRIMARY KEY,
-                    model TEXT NOT NULL,
-                    mode TEXT DEFAULT 'simple',
-                    created_at TEXT NOT NULL,
-                    updated_at TEXT NOT NULL,
-                    message_count INTEGER DEFAULT 0,
-                    title TEXT,
-                    metadata_json TEXT
-                )
-            """)
-
-            # Create messages table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    conversation_id TEXT NOT NULL,
-                    role TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    model TEXT,
-                    message_type TEXT,
-                    iteration INTEGER,
-                    metadata_json TEXT,
-                    FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
-                )
-            """)
-
-            # Create indexes for performance
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_conversation
-                ON messages(conversation_id)
-            """)
+        # One long-lived connection for writes; opening per call pays a
+        # thread spawn and sqlite3_open for every statement
+        db = self._conn = await aiosqlite.connect(self.database_path)
+        db.row_factory = aiosqlite.Row
+
+        # Enable foreign keys
+        await db.execute("PRAGMA foreign_keys = ON")
+
+        # Write-ahead log with NORMAL syncing: commits append to the WAL
+        # without fsyncing the main database on every transaction, and
+        # readers no longer block the writer. WAL leaves -wal and -shm
+        # sidecar files next to the database file.
+        await db.execute("PRAGMA journal_mode = WAL")
+        await db.execute("PRAGMA synchronous = NORMAL")
+        # Keep temp structures and hot pages in memory (cache_size is in
+        # KiB when negative), and memory-map reads up to 256 MiB
+        await db.execute("PRAGMA temp_store = MEMORY")
+        await db.execute("PRAGMA cache_size = -131072")
+        await db.execute("PRAGMA mmap_size = 268435456")
+        await db.execute("PRAGMA wal_autocheckpoint = 1000")
+        await db.execute("PRAGMA busy_timeout = 5000")
+
+        # Create conversations table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS conversations (
+                id TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                mode TEXT DEFAULT 'simple',
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL,
+                message_count INTEGER DEFAULT 0,
+                title TEXT,
+                metadata_json TEXT,
+                debate_state_json TEXT
+            )
+        """)
 
-            await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_messages_timestamp
-                ON messages(timestamp)
-            """)
+        # Databases created before debate_state_json existed need the
+        # column added in place (CREATE TABLE IF NOT EXISTS won't do it)
+        async with db.execute("PRAGMA table_info(conversations)") as cursor:
+            columns = {row["name"] for row in await cursor.fetchall()}
+        if "debate_state_json" not in columns:
+            await db.execute(
+                "ALTER TABLE conversations ADD COLUMN debate_state_json TEXT"
+            )
 
-            await db.commit()
+        # Databases from before the epoch-ms switch stored ISO-8601 text
+        # timestamps; rewrite them as integers so comparisons and the
+        # recency index stay type-consistent (SQLite orders all integers
+        # before all text, which would break mixed ordering)
+        await db.execute("""
+            UPDATE conversations
+            SET created_at = CAST(strftime('%s', created_at) AS INTEGER) * 1000,
+                updated_at = CAST(strftime('%s', updated_at) AS INTEGER) * 1000
+            WHERE typeof(created_at) = 'text'
+        """)
+
+        # Create messages table
+        await db.execute("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                conversation_id TEXT NOT NULL,
+                role TEXT NOT NULL,
+                content TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                model TEXT,
+                message_type TEXT,
+                iteration INTEGER,
+                metadata_json TEXT,
+                FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
+            )
+        """)
+
+        await db.execute("""
+            UPDATE messages
+            SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER) * 1000
+            WHERE typeof(timestamp) = 'text'
+        """)
+
+        # Create indexes for performance. The composite index lets
+        # get_messages scan a conversation already in insertion order
+        # with no sort step.
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_messages_conv_id
+            ON messages(conversation_id, id)
+        """)
+
+        # No query filters messages by timestamp alone (reads go through
+        # the conversation_id composite index), so the old timestamp
+        # index only added a B-tree update per insert; drop it from
+        # existing databases too
+        await db.execute("DROP INDEX IF EXISTS idx_messages_timestamp")
+
+        # Serves both the plain recency listing and keyset pagination
+        # without a sort step
+        await db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_conv_updated_id
+            ON conversations(updated_at DESC, id DESC)
+        """)
+
+        # Keep message_count and updated_at in sync inside SQLite so the
+        # write path is a bare INSERT per message
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_messages_insert
+            AFTER INSERT ON messages
+            BEGIN
+                UPDATE conversations
+                SET message_count = message_count + 1,
+                    updated_at = NEW.timestamp
+                WHERE id = NEW.conversation_id;
+            END
+        """)
+
+        await db.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_messages_delete
+            AFTER DELETE ON messages
+            BEGIN
+                UPDATE conversations
+                SET message_count = message_count - 1
+                WHERE id = OLD.conversation_id;
+            END
+        """)
+
+        await db.commit()
+
+        # Writes stay serialized on the one connection above (SQLite
+        # allows a single writer anyway); reads get their own small pool
+        # so they don't queue behind the writer's thread
+        pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(self._READ_POOL_SIZE):
+            reader = await aiosqlite.connect(self.database_path)
+            reader.row_factory = aiosqlite.Row
+            await reader.execute("PRAGMA temp_store = MEMORY")
+            await reader.execute("PRAGMA cache_size = -32768")
+            await reader.execute("PRAGMA mmap_size = 268435456")
+            await reader.execute("PRAGMA busy_timeout = 5000")
+            pool.put_nowait(reader)
+        self._read_pool = pool
 
         self._initialized = True
         logger.info(f"SQLite storage initialized at {self.database_path}")
 
+    @asynccontextmanager
+    async def _read_conn(self):
+        """Borrow a read connection from the pool."""
+        conn = await self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put_nowait(conn)
+
+    @staticmethod
+    def _decode_metadata(metadata_json: Optional[str]) -> Dict:
+        """Parse a metadata_json cell, tolerating NULL and bad JSON."""
+        if not metadata_json:
+            return {}
+        try:
+            return orjson.loads(metadata_json)
+        except orjson.JSONDecodeError:
+            return {}
+
+    @classmethod
+    def _decode_conversation(cls, row) -> Dict:
+        """Build a conversation dict straight from an explicit-column row.
+
+        Unpacking the row and writing one dict literal avoids the
+        dict(row) copy plus key rewrite that the old path paid per row.
+        """
+        (conv_id, model, mode, created_at, updated_at,
+         message_count, title, metadata_json) = row
+        return {
+            "id": conv_id,
+            "model": model,
+            "mode": mode,
+            "created_at": ms_to_iso(created_at),
+            "updated_at": ms_to_iso(updated_at),
+            "message_count": message_count,
+            "title": title,
+            "metadata": cls._decode_metadata(metadata_json)
+        }
+
     async def get_conversation(self, conversation_id: str) -> Optional[Dict]:
         """Get conversation metadata."""
         await self._init_db()
-
-        async with aiosqlite.connect(self.database_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                "SELECT * FROM conversations WHERE id = ?",
-                (conversation_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if not row:
-                    return None
-
-                # Convert to dict
-                conv = dict(row)
-                # Parse metadata JSON
-                if conv.get("metadata_json"):
-                    try:
-                        conv["metadata"] = json.loads(conv["metadata_json"])
-                    except json.JSONDecodeError:
-                        conv["metadata"] = {}
-                else:
-                    conv["metadata"] = {}
-                del conv["metadata_json"]
-
-                return conv
+        await self._flush_pending()
+
+        async with self._read_conn() as conn, conn.execute(
+            """
+            SELECT id, model, mode, created_at, updated_at,
+                   message_count, title, metadata_json
+            FROM conversations WHERE id = ?
+            """,
+            (conversation_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+            if not row:
+                return None
+
+            return self._decode_conversation(row)
 
     async def get_messages(self, conversation_id: str) -> List[Dict]:
-        """Get all messages in a conversation."""
-        await self._init_db()
+        """Get all messages in a conversation.
 
-        async with aiosqlite.connect(self.database_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT role, content, timestamp, model, message_type,
-                       iteration, metadata_json
-                FROM messages
-                WHERE conversation_id = ?
-                ORDER BY timestamp ASC
-                """,
-                (conversation_id,)
-            ) as cursor:
-                rows = await cursor.fetchall()
-
-                messages = []
-                for row in rows:
-                    msg = dict(row)
-                    # Parse metadata JSON
-                    if msg.get("metadata_json"):
-                        try:
-                            msg["metadata"] = json.loads(msg["metadata_json"])
-                        except json.JSONDecodeError:
-                            msg["metadata"] = {}
-                    else:
-                        msg["metadata"] = {}
-                    del msg["metadata_json"]
-
-                    messages.append(msg)
+        The chat routes re-read the full history on every send, so the
+        decoded list is cached per conversation; add_message appends to
+        the cached list, keeping hits valid without a flush.
+        """
+        cached = self._msg_cache.get(conversation_id)
+        if cached is not None:
+            self._msg_cache.move_to_end(conversation_id)
+            return list(cached)
 
-                return messages
+        await self._init_db()
+        await self._flush_pending()
+
+        async with self._read_conn() as conn, conn.execute(
+            """
+            SELECT role, content, timestamp, model, message_type,
+                   iteration, metadata_json
+            FROM messages
+            WHERE conversation_id = ?
+            ORDER BY id ASC
+            """,
+            (conversation_id,)
+        ) as cursor:
+            rows = await cursor.fetchall()
+
+            decode_metadata = self._decode_metadata
+            messages = [
+                {
+                    "role": role,
+                    "content": content,
+                    "timestamp": ms_to_iso(timestamp),
+                    "model": model,
+                    "message_type": message_type,
+                    "iteration": iteration,
+                    "metadata": decode_metadata(metadata_json)
+                }
+                for (role, content, timestamp, model,
+                     message_type, iteration, metadata_json) in rows
+            ]
+
+            self._msg_cache[conversation_id] = messages
+            if len(self._msg_cache) > self._MSG_CACHE_SIZE:
+                self._msg_cache.popitem(last=False)
+            return list(messages)
 
     async def add_message(
         self,
@@ -182,47 +359,103 @@ class SQLiteStorage(ConversationStorage):
         """
         await self._init_db()
 
-        # Ensure conversation exists
-        conv = await self.get_conversation(conversation_id)
-        if not conv:
-            await self.create_conversation(conversation_id, model or "unknown")
-
         # Serialize metadata
-        metadata_json = json.dumps(metadata) if metadata else None
+        metadata_json = orjson.dumps(metadata).decode() if metadata else None
+        timestamp = now_ms()
 
-        async with aiosqlite.connect(self.database_path) as db:
-            # Insert message
-            await db.execute(
-                """
-                INSERT INTO messages
-                (conversation_id, role, content, timestamp, model,
-                 message_type, iteration, metadata_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    conversation_id,
-                    role,
-                    content,
-                    datetime.now().isoformat(),
-                    model,
-                    message_type,
-                    iteration,
-                    metadata_json
-                )
-            )
+        self._pending.append((
+            conversation_id,
+            role,
+            content,
+            timestamp,
+            model,
+            message_type,
+            iteration,
+            metadata_json
+        ))
+
+        # Keep the cached history current so reads stay cache hits
+        cached = self._msg_cache.get(conversation_id)
+        if cached is not None:
+            cached.append({
+                "role": role,
+                "content": content,
+                "timestamp": ms_to_iso(timestamp),
+                "model": model,
+                "message_type": message_type,
+                "iteration": iteration,
+                "metadata": dict(metadata) if metadata else {}
+            })
+
+        if len(self._pending) >= self._PENDING_FLUSH_THRESHOLD:
+            await self._flush_pending()
+
+    async def _flush_pending(self):
+        """Write all buffered messages in a single transaction.
+
+        Called when the buffer fills and before every operation that
+        reads message rows or conversation update metadata, so callers
+        never observe stale data.
+        """
+        if not self._pending:
+            return
 
-            # Update conversation metadata
-            await db.execute(
-                """
-                UPDATE conversations
-                SET updated_at = ?,
-                    message_count = message_count + 1
-                WHERE id = ?
-                """,
-                (datetime.now().isoformat(), conversation_id)
-            )
+        async with self._write_lock:
+            pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            # Creation defaults for conversations seen for the first
+            # time (model and timestamp of their first message);
+            # message_count and updated_at are maintained by triggers
+            seen = set()
+            conv_inserts = []
+            for row in pending:
+                if row[0] not in seen:
+                    seen.add(row[0])
+                    conv_inserts.append((
+                        row[0],
+                        row[4] or "unknown",
+                        "simple",
+                        row[3],
+                        row[3],
+                        0,
+                        "New Conversation",
+                        None
+                    ))
+
+            db = self._conn
+            try:
+                # Create any conversations that don't exist yet in the
+                # same transaction, instead of a SELECT + INSERT round
+                # trip per add_message
+                await db.executemany(
+                    """
+                    INSERT OR IGNORE INTO conversations
+                    (id, model, mode, created_at, updated_at,
+                     message_count, title, metadata_json)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    conv_inserts
+                )
+                await db.executemany(
+                    """
+                    INSERT INTO messages
+                    (conversation_id, role, content, timestamp, model,
+                     message_type, iteration, metadata_json)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    pending
+                )
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
 
-            await db.commit()
+            # The flush may have created conversations that a recent
+            # existence check cached as missing
+            for conversation_id in seen:
+                self._exists_cache.pop(conversation_id, None)
 
     async def create_conversation(
         self,
@@ -245,11 +478,11 @@ class SQLiteStorage(ConversationStorage):
         await self._init_db()
 
         # Serialize metadata
-        metadata_json = json.dumps(metadata) if metadata else None
+        metadata_json = orjson.dumps(metadata).decode() if metadata else None
 
-        async with aiosqlite.connect(self.database_path) as db:
+        async with self._write_lock:
             try:
-                await db.execute(
+                await self._conn.execute(
                     """
                     INSERT INTO conversations
                     (id, model, mode, created_at, updated_at,
@@ -260,78 +493,109 @@ class SQLiteStorage(ConversationStorage):
                         conversation_id,
                         model,
                         mode,
-                        datetime.now().isoformat(),
-                        datetime.now().isoformat(),
+                        now_ms(),
+                        now_ms(),
                         0,
                         title or "New Conversation",
                         metadata_json
                     )
                 )
-                await db.commit()
+                await self._conn.commit()
             except sqlite3.IntegrityError:
                 # Conversation already exists
                 pass
 
+        self._cache_exists(conversation_id, True)
+
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation and all its messages."""
         await self._init_db()
+        await self._flush_pending()
 
-        async with aiosqlite.connect(self.database_path) as db:
-            cursor = await db.execute(
+        async with self._write_lock:
+            cursor = await self._conn.execute(
                 "DELETE FROM conversations WHERE id = ?",
                 (conversation_id,)
             )
-            await db.commit()
+            await self._conn.commit()
+            self._exists_cache.pop(conversation_id, None)
+            self._msg_cache.pop(conversation_id, None)
             return cursor.rowcount > 0
 
     async def list_conversations(
         self,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after_updated_at: Optional[str] = None,
+        after_id: Optional[str] = None
     ) -> List[Dict]:
-        """List all conversations."""
-        await self._init_db()
+        """List all conversations, most recently updated first.
 
-        async with aiosqlite.connect(self.database_path) as db:
-            db.row_factory = aiosqlite.Row
-            async with db.execute(
-                """
-                SELECT * FROM conversations
-                ORDER BY updated_at DESC
+        With a keyset cursor the query seeks straight to the right spot
+        in idx_conv_updated_id, instead of scanning and discarding
+        `offset` rows the way LIMIT/OFFSET does on deep pages.
+        """
+        await self._init_db()
+        await self._flush_pending()
+
+        if after_updated_at is not None and after_id is not None:
+            query = """
+                SELECT id, model, mode, created_at, updated_at,
+                       message_count, title, metadata_json
+                FROM conversations
+                WHERE (updated_at, id) < (?, ?)
+                ORDER BY updated_at DESC, id DESC
+                LIMIT ?
+            """
+            params = (iso_to_ms(after_updated_at), after_id, limit)
+        else:
+            query = """
+                SELECT id, model, mode, created_at, updated_at,
+                       message_count, title, metadata_json
+                FROM conversations
+                ORDER BY updated_at DESC, id DESC
                 LIMIT ? OFFSET ?
-                """,
-                (limit, offset)
-            ) as cursor:
-                rows = await cursor.fetchall()
+            """
+            params = (limit, offset)
 
-                conversations = []
-                for row in rows:
-                    conv = dict(row)
-                    # Parse metadata JSON
-                    if conv.get("metadata_json"):
-                        try:
-                            conv["metadata"] = json.loads(conv["metadata_json"])
-                        except json.JSONDecodeError:
-                            conv["metadata"] = {}
-                    else:
-                        conv["metadata"] = {}
-                    del conv["metadata_json"]
+        async with self._read_conn() as conn, conn.execute(query, params) as cursor:
+            rows = await cursor.fetchall()
 
-                    conversations.append(conv)
+            return [self._decode_conversation(row) for row in rows]
 
-                return conversations
+    def _cache_exists(self, conversation_id: str, exists: bool) -> None:
+        """Remember an existence check result, evicting the oldest entry."""
+        cache = self._exists_cache
+        cache[conversation_id] = (exists, time.monotonic())
+        cache.move_to_end(conversation_id)
+        if len(cache) > self._EXISTS_CACHE_SIZE:
+            cache.popitem(last=False)
 
     async def conversation_exists(self, conversation_id: str) -> bool:
-        """Check if a conversation exists."""
+        """Check if a conversation exists.
+
+        Hot IDs are answered from a small process-local cache instead of
+        a query round-trip through the sqlite thread per call.
+        """
+        cached = self._exists_cache.get(conversation_id)
+        if cached is not None:
+            exists, cached_at = cached
+            if time.monotonic() - cached_at < self._EXISTS_CACHE_TTL:
+                self._exists_cache.move_to_end(conversation_id)
+                return exists
+
         await self._init_db()
+        await self._flush_pending()
 
-        async with aiosqlite.connect(self.database_path) as db:
-            async with db.execute(
-                "SELECT 1 FROM conversations WHERE id = ? LIMIT 1",
-                (conversation_id,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                return row is not None
+        async with self._read_conn() as conn, conn.execute(
+            "SELECT 1 FROM conversations WHERE id = ? LIMIT 1",
+            (conversation_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        exists = row is not None
+        self._cache_exists(conversation_id, exists)
+        return exists
 
     async def update_conversation_title(
         self,
@@ -340,17 +604,18 @@ class SQLiteStorage(ConversationStorage):
     ) -> bool:
         """Update the title of a conversation."""
         await self._init_db()
+        await self._flush_pending()
 
-        async with aiosqlite.connect(self.database_path) as db:
-            cursor = await db.execute(
+        async with self._write_lock:
+            cursor = await self._conn.execute(
                 """
                 UPDATE conversations
                 SET title = ?, updated_at = ?
                 WHERE id = ?
                 """,
-                (title, datetime.now().isoformat(), conversation_id)
+                (title, now_ms(), conversation_id)
             )
-            await db.commit()
+            await self._conn.commit()
             return cursor.rowcount > 0
 
     async def update_conversation_metadata(
@@ -361,6 +626,9 @@ class SQLiteStorage(ConversationStorage):
         """
         Update conversation metadata.
 
+        The merge happens inside SQLite via json_patch, so the update is
+        one statement with no readback of the existing blob.
+
         Args:
             conversation_id: Unique conversation identifier
             metadata: New metadata to merge with existing
@@ -369,50 +637,28 @@ class SQLiteStorage(ConversationStorage):
             True if updated, False if conversation not found
         """
         await self._init_db()
-
-        # Get existing conversation
-        conv = await self.get_conversation(conversation_id)
-        if not conv:
-            return False
+        await self._flush_pending()
 
         # Extract mode if present in metadata
         mode = metadata.pop("mode", None)
 
-        # Merge metadata
-        existing_metadata = conv.get("metadata", {})
-        merged_metadata = {**existing_metadata, **metadata}
-
-        async with aiosqlite.connect(self.database_path) as db:
-            if mode:
-                # Update both mode and metadata
-                cursor = await db.execute(
-                    """
-                    UPDATE conversations
-                    SET mode = ?, metadata_json = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        mode,
-                        json.dumps(merged_metadata),
-                        datetime.now().isoformat(),
-                        conversation_id
-                    )
-                )
-            else:
-                # Update only metadata
-                cursor = await db.execute(
-                    """
-                    UPDATE conversations
-                    SET metadata_json = ?, updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        json.dumps(merged_metadata),
-                        datetime.now().isoformat(),
-                        conversation_id
-                    )
+        async with self._write_lock:
+            cursor = await self._conn.execute(
+                """
+                UPDATE conversations
+                SET mode = COALESCE(?, mode),
+                    metadata_json = json_patch(COALESCE(metadata_json, '{}'), ?),
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    mode,
+                    orjson.dumps(metadata).decode(),
+                    now_ms(),
+                    conversation_id
                 )
-            await db.commit()
+            )
+            await self._conn.commit()
             return cursor.rowcount > 0
 
     async def update_debate_state(
@@ -421,7 +667,10 @@ class SQLiteStorage(ConversationStorage):
         debate_state: Dict
     ) -> bool:
         """
-        Update debate state in conversation metadata.
+        Update the debate state for a conversation.
+
+        The state lives in its own column so a debate turn rewrites one
+        cell instead of read-merge-rewriting the whole metadata blob.
 
         Args:
             conversation_id: Unique conversation identifier
@@ -430,14 +679,28 @@ class SQLiteStorage(ConversationStorage):
         Returns:
             True if updated, False if conversation not found
         """
-        return await self.update_conversation_metadata(
-            conversation_id,
-            {"debate_state": debate_state}
-        )
+        await self._init_db()
+        await self._flush_pending()
+
+        async with self._write_lock:
+            cursor = await self._conn.execute(
+                """
+                UPDATE conversations
+                SET debate_state_json = ?, updated_at = ?
+                WHERE id = ?
+                """,
+                (
+                    orjson.dumps(debate_state).decode(),
+                    now_ms(),
+                    conversation_id
+                )
+            )
+            await self._conn.commit()
+            return cursor.rowcount > 0
 
     async def get_debate_state(self, conversation_id: str) -> Optional[Dict]:
         """
-        Get debate state from conversation metadata.
+        Get the debate state for a conversation.
 
         Args:
             conversation_id: Unique conversation identifier
@@ -445,24 +708,66 @@ class SQLiteStorage(ConversationStorage):
         Returns:
             Debate state dict or None
         """
-        conv = await self.get_conversation(conversation_id)
-        if not conv:
+        await self._init_db()
+
+        async with self._read_conn() as conn, conn.execute(
+            """
+            SELECT debate_state_json, metadata_json
+            FROM conversations WHERE id = ?
+            """,
+            (conversation_id,)
+        ) as cursor:
+            row = await cursor.fetchone()
+
+        if row is None:
             return None
 
-        return conv.get("metadata", {}).get("debate_state")
+        if row["debate_state_json"]:
+            try:
+                return orjson.loads(row["debate_state_json"])
+            except orjson.JSONDecodeError:
+                return None
+
+        # Rows written before the dedicated column kept the state nested
+        # inside metadata_json
+        if row["metadata_json"]:
+            try:
+                return orjson.loads(row["metadata_json"]).get("debate_state")
+            except orjson.JSONDecodeError:
+                return None
+
+        return None
 
     async def delete_all_conversations(self) -> int:
         """Delete all conversations and their messages."""
         await self._init_db()
+        await self._flush_pending()
 
-        async with aiosqlite.connect(self.database_path) as db:
+        async with self._write_lock:
             # Count conversations
-            async with db.execute("SELECT COUNT(*) FROM conversations") as cursor:
+            async with self._conn.execute(
+                "SELECT COUNT(*) FROM conversations"
+            ) as cursor:
                 row = await cursor.fetchone()
                 count = row[0] if row else 0
 
             # Delete all
-            await db.execute("DELETE FROM conversations")
-            await db.commit()
+            await self._conn.execute("DELETE FROM conversations")
+            await self._conn.commit()
+            self._exists_cache.clear()
+            self._msg_cache.clear()
 
             return count
+
+    async def close(self):
+        """Flush pending writes and close all connections."""
+        if self._conn is None:
+            return
+        await self._flush_pending()
+        await self._conn.close()
+        self._conn = None
+        while self._read_pool is not None and not self._read_pool.empty():
+            reader = self._read_pool.get_nowait()
+            await reader.close()
+        self._read_pool = None
+        self._initialized = False
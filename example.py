@@ -0,0 +1,164 @@
+"""
+Command-line example for the unified LLM backend.
+
+Talks to the providers directly through LangGraphAgent -- no HTTP
+server needed. Pass one or more questions for one-shot mode, or run
+with no arguments for an interactive chat session.
+
+Usage:
+    python example.py "Why is the sky blue?"
+    python example.py --model qwen-max "Summarize WAL mode in SQLite"
+    python example.py
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+
+from backend.config import settings
+from backend.core.agent import LangGraphAgent
+
+# Separator bar for question banners, built once
+_BAR = "=" * 60
+
+
+async def _drain(stream, min_chars: int = 64, max_delay: float = 0.03) -> None:
+    """Print a token stream with batched stdout writes.
+
+    Writing and flushing every chunk costs a syscall per token. Chunks
+    are buffered and flushed once min_chars accumulate or the producer
+    stalls for max_delay seconds, which keeps the typing feel while
+    collapsing most of the writes.
+
+    The first chunk is written immediately, never buffered, so batching
+    cannot worsen the perceived time-to-first-token.
+    """
+    # Bound locals skip the module-attribute and method lookups that
+    # print() and sys.stdout.write would repeat on every chunk
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    buf = []
+    nchars = 0
+    first = True
+    iterator = stream.__aiter__()
+    pending = None
+    while True:
+        if pending is None:
+            pending = asyncio.ensure_future(anext(iterator))
+        try:
+            if buf:
+                # shield() so a timeout only flushes the buffer instead
+                # of cancelling the generator mid-chunk
+                chunk = await asyncio.wait_for(
+                    asyncio.shield(pending), max_delay
+                )
+            else:
+                # Nothing buffered means nothing to flush on a stall;
+                # wait for the next chunk without waking on a timer
+                chunk = await pending
+        except asyncio.TimeoutError:
+            write("".join(buf))
+            flush()
+            buf.clear()
+            nchars = 0
+            continue
+        except StopAsyncIteration:
+            break
+        pending = None
+        if first:
+            first = False
+            write(chunk)
+            flush()
+            continue
+        buf.append(chunk)
+        nchars += len(chunk)
+        if nchars >= min_chars:
+            write("".join(buf))
+            flush()
+            buf.clear()
+            nchars = 0
+    if buf:
+        write("".join(buf))
+    write("\n")
+    flush()
+
+
+async def ask(agent: LangGraphAgent, question: str, number: int) -> None:
+    """Stream the answer to one question with a banner."""
+    print(f"\n{_BAR}\nQuestion {number}: {question}\n{_BAR}\n\nStreaming response:\n")
+    await _drain(agent.stream(question))
+
+
+async def interactive_mode(agent: LangGraphAgent) -> None:
+    """Multi-turn chat session against a single conversation."""
+    conversation_id = str(uuid.uuid4())
+    print(f"\nChatting with {agent.model_id}.")
+    print("Type 'models' to list available models, 'exit' to quit.")
+
+    # Rendered once on first use; the model tables are static per run
+    models_listing = None
+
+    while True:
+        try:
+            # input() would block the event loop for the whole prompt;
+            # a worker thread keeps timers and background tasks running
+            question = (await asyncio.to_thread(input, "\nYour question: ")).strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            return
+
+        if not question:
+            continue
+        if question.lower() in ("exit", "quit"):
+            return
+        if question.lower() == "models":
+            if models_listing is None:
+                from backend.providers import ProviderFactory
+                models_listing = "\n".join(
+                    f"  {model['model_id']} ({model['provider']})"
+                    for model in ProviderFactory.list_all_models()
+                )
+            print(models_listing)
+            continue
+
+        print()
+        await _drain(agent.stream(question, conversation_id=conversation_id))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Stream answers from any configured LLM provider."
+    )
+    parser.add_argument(
+        "questions",
+        nargs="*",
+        help="Questions to ask; omit for an interactive session"
+    )
+    parser.add_argument(
+        "--model",
+        default=settings.default_model,
+        help=f"Model ID to use (default: {settings.default_model})"
+    )
+    args = parser.parse_args()
+
+    agent = LangGraphAgent(model_id=args.model)
+
+    if not args.questions:
+        await interactive_mode(agent)
+        return
+
+    for number, question in enumerate(args.questions, start=1):
+        await ask(agent, question, number)
+
+
+if __name__ == "__main__":
+    # Same loop choice as backend.main: uvloop when available (not on
+    # Windows), otherwise the stock asyncio loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+    asyncio.run(main())
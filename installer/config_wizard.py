@@ -88,6 +88,13 @@ class ConfigWizard:
         # Store API keys
         self.api_keys = {}
         self.key_entries = {}
+        self._env_mtime = None
+
+        # Configured-provider count maintained by per-entry traces, so
+        # the status bar never has to poll every Entry widget
+        self.status_label = None
+        self._configured_count = 0
+        self._key_configured = {}
 
         # Load existing configuration if available
         self.load_existing_config()
@@ -98,16 +105,27 @@ class ConfigWizard:
     def load_existing_config(self):
         """Load existing configuration from .env file if it exists"""
         env_path = Path(__file__).parent.parent / ".env"
-        if env_path.exists():
-            try:
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#') and '=' in line:
-                            key, value = line.split('=', 1)
-                            self.api_keys[key.strip()] = value.strip()
-            except Exception as e:
-                print(f"Warning: Could not load existing config: {e}")
+        if not env_path.exists():
+            return
+        try:
+            # Skip re-reading (and re-parsing) an unchanged file
+            mtime = env_path.stat().st_mtime
+            if mtime == self._env_mtime:
+                return
+
+            # One read, one pass: filter comments/blanks and split on
+            # the first '=' in a single comprehension
+            self.api_keys = {
+                key.strip(): value.strip()
+                for key, _, value in (
+                    line.partition('=')
+                    for line in map(str.strip, env_path.read_text().splitlines())
+                    if line and line[0] != '#' and '=' in line
+                )
+            }
+            self._env_mtime = mtime
+        except Exception as e:
+            print(f"Warning: Could not load existing config: {e}")
 
     def create_ui(self):
         """Create the user interface"""
@@ -159,9 +177,13 @@ class ConfigWizard:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Add provider configuration sections
-        for provider_id, provider_info in self.PROVIDERS.items():
-            self.create_provider_section(scrollable_frame, provider_id, provider_info)
+        # Build the first provider section now and paint, then stream
+        # the rest in during mainloop idle cycles so the window never
+        # sits blank while all the widgets are created
+        self._sections_parent = scrollable_frame
+        self._pending_sections = iter(self.PROVIDERS.items())
+        self._build_next_section()
+        self.root.update_idletasks()
 
         # Status bar
         self.status_frame = tk.Frame(self.root, bg='#ecf0f1', height=40)
@@ -197,8 +219,22 @@ class ConfigWizard:
         )
         save_button.pack(side=tk.RIGHT, padx=20)
 
+    def _build_next_section(self):
+        """Build one provider section, then hand control back to Tk"""
+        try:
+            provider_id, provider_info = next(self._pending_sections)
+        except StopIteration:
+            return
+        self.create_provider_section(self._sections_parent, provider_id, provider_info)
+        self.root.after_idle(self._build_next_section)
+
     def create_provider_section(self, parent, provider_id, provider_info):
-        """Create a configuration section for a provider"""
+        """Create a configuration section for a provider.
+
+        All widgets are created first and laid out in one batch at the
+        end, so the geometry manager reflows the section once instead of
+        once per pack() call.
+        """
         # Provider frame
         provider_frame = tk.LabelFrame(
             parent,
@@ -208,7 +244,6 @@ class ConfigWizard:
             padx=10,
             pady=10
         )
-        provider_frame.pack(fill=tk.X, padx=10, pady=5)
 
         # Description
         desc_label = tk.Label(
@@ -219,11 +254,9 @@ class ConfigWizard:
             fg='#7f8c8d',
             justify=tk.LEFT
         )
-        desc_label.pack(anchor=tk.W, pady=(0, 5))
 
         # API Key entry
         key_frame = tk.Frame(provider_frame, bg='white')
-        key_frame.pack(fill=tk.X, pady=5)
 
         key_label = tk.Label(
             key_frame,
@@ -233,23 +266,31 @@ class ConfigWizard:
             width=10,
             anchor=tk.W
         )
-        key_label.pack(side=tk.LEFT)
 
         # Get existing value if available
         existing_value = self.api_keys.get(provider_info['key_var'], '')
 
+        key_text = tk.StringVar(value=existing_value)
         key_entry = tk.Entry(
             key_frame,
             font=('Arial', 10),
             width=50,
-            show='*'
+            show='*',
+            textvariable=key_text
         )
-        key_entry.insert(0, existing_value)
-        key_entry.pack(side=tk.LEFT, padx=5)
 
         # Store reference
         self.key_entries[provider_info['key_var']] = key_entry
 
+        # Track configuration state per keystroke instead of polling
+        # every entry when the status bar refreshes
+        key_var = provider_info['key_var']
+        key_text.trace_add(
+            'write',
+            lambda *_, kv=key_var, var=key_text: self._on_key_changed(kv, var)
+        )
+        self._on_key_changed(key_var, key_text)
+
         # Show/Hide button
         show_var = tk.BooleanVar(value=False)
 
@@ -266,7 +307,6 @@ class ConfigWizard:
             command=toggle_password,
             width=8
         )
-        show_button.pack(side=tk.LEFT)
 
         # Get API key link
         link_label = tk.Label(
@@ -277,13 +317,21 @@ class ConfigWizard:
             fg='#3498db',
             cursor='hand2'
         )
-        link_label.pack(anchor=tk.W, pady=(0, 5))
         link_label.bind('<Button-1>', lambda e: webbrowser.open(provider_info['url']))
 
+        layout = [
+            (provider_frame, {'fill': tk.X, 'padx': 10, 'pady': 5}),
+            (desc_label, {'anchor': tk.W, 'pady': (0, 5)}),
+            (key_frame, {'fill': tk.X, 'pady': 5}),
+            (key_label, {'side': tk.LEFT}),
+            (key_entry, {'side': tk.LEFT, 'padx': 5}),
+            (show_button, {'side': tk.LEFT}),
+            (link_label, {'anchor': tk.W, 'pady': (0, 5)})
+        ]
+
         # Base URL if applicable
         if provider_info['base_url_var']:
             url_frame = tk.Frame(provider_frame, bg='white')
-            url_frame.pack(fill=tk.X, pady=5)
 
             url_label = tk.Label(
                 url_frame,
@@ -293,7 +341,6 @@ class ConfigWizard:
                 width=10,
                 anchor=tk.W
             )
-            url_label.pack(side=tk.LEFT)
 
             existing_url = self.api_keys.get(
                 provider_info['base_url_var'],
@@ -306,20 +353,32 @@ class ConfigWizard:
                 width=50
             )
             url_entry.insert(0, existing_url)
-            url_entry.pack(side=tk.LEFT, padx=5)
 
             # Store reference
             self.key_entries[provider_info['base_url_var']] = url_entry
 
+            layout += [
+                (url_frame, {'fill': tk.X, 'pady': 5}),
+                (url_label, {'side': tk.LEFT}),
+                (url_entry, {'side': tk.LEFT, 'padx': 5})
+            ]
+
+        for widget, opts in layout:
+            widget.pack(**opts)
+
+    def _on_key_changed(self, key_var, var):
+        """Keep the configured-provider counter in step with one entry"""
+        value = var.get().strip()
+        configured = bool(value) and not value.startswith('your_')
+        if configured != self._key_configured.get(key_var, False):
+            self._key_configured[key_var] = configured
+            self._configured_count += 1 if configured else -1
+            if self.status_label is not None:
+                self.status_label.config(text=self.get_status_text())
+
     def get_status_text(self):
         """Get status text showing how many providers are configured"""
-        configured = sum(
-            1 for provider_info in self.PROVIDERS.values()
-            if self.key_entries.get(provider_info['key_var'], None) and
-            self.key_entries[provider_info['key_var']].get().strip() and
-            self.key_entries[provider_info['key_var']].get().strip() not in ['your_', '']
-        )
-        return f"Status: {configured}/{len(self.PROVIDERS)} providers configured"
+        return f"Status: {self._configured_count}/{len(self.PROVIDERS)} providers configured"
 
     def save_config(self):
         """Save configuration to .env file"""
@@ -348,25 +407,28 @@ class ConfigWizard:
         env_path = Path(__file__).parent.parent / ".env"
 
         try:
-            with open(env_path, 'w') as f:
-                f.write("# UnifyLLM API Configuration\n")
-                f.write("# Generated by Configuration Wizard\n\n")
+            # Assemble the whole file in memory and write it once,
+            # instead of a stream of small writes per provider
+            parts = [
+                "# UnifyLLM API Configuration\n",
+                "# Generated by Configuration Wizard\n\n"
+            ]
+
+            for provider_id, provider_info in self.PROVIDERS.items():
+                key_var = provider_info['key_var']
 
-                # Write configuration for each provider
-                for provider_id, provider_info in self.PROVIDERS.items():
-                    key_var = provider_info['key_var']
+                if key_var in config_data:
+                    parts.append(f"# {provider_info['name']}\n")
+                    parts.append(f"{key_var}={config_data[key_var]}\n")
 
-                    if key_var in config_data:
-                        f.write(f"# {provider_info['name']}\n")
-                        f.write(f"{key_var}={config_data[key_var]}\n")
+                    # Write base URL if applicable
+                    base_url_var = provider_info['base_url_var']
+                    if base_url_var and base_url_var in config_data:
+                        parts.append(f"{base_url_var}={config_data[base_url_var]}\n")
 
-                        # Write base URL if applicable
-                        if provider_info['base_url_var']:
-                            base_url_var = provider_info['base_url_var']
-                            if base_url_var in config_data:
-                                f.write(f"{base_url_var}={config_data[base_url_var]}\n")
+                    parts.append("\n")
 
-                        f.write("\n")
+            env_path.write_text("".join(parts))
 
             messagebox.showinfo(
                 "Configuration Saved",
@@ -398,8 +460,10 @@ class ConfigWizard:
 
             if template_path.exists() and not env_path.exists():
                 try:
-                    import shutil
-                    shutil.copy(template_path, env_path)
+                    # One read + one write; the template is tiny and
+                    # shutil.copy's stat/chunked-copy/copymode dance
+                    # buys nothing here
+                    env_path.write_bytes(template_path.read_bytes())
                 except Exception:
                     pass
 
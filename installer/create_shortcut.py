@@ -4,10 +4,90 @@ Create Windows Desktop Shortcut for UnifyLLM
 This script creates a desktop shortcut on Windows systems
 """
 
+import importlib
 import os
 import sys
 from pathlib import Path
 
+# Resolved once at import: Path.resolve() stats every component, no
+# need to repeat that per call
+_HERE = Path(__file__).resolve().parent
+_APP_DIR = _HERE.parent
+_LAUNCHER_BAT_STR = str(_APP_DIR / "launcher.bat").replace('/', '\\')
+_WORKING_DIR_STR = str(_APP_DIR).replace('/', '\\')
+
+
+def _create_shortcut_com(shortcut_path, target, working_dir, description, icon):
+    """Create a .lnk file through the IShellLink COM interface via ctypes.
+
+    This keeps the no-pywin32 path in-process: no VBScript temp file,
+    no cscript.exe spawn, no WSH startup cost.
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    class GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", wintypes.DWORD),
+            ("Data2", wintypes.WORD),
+            ("Data3", wintypes.WORD),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+
+    ole32 = ctypes.oledll.ole32
+
+    def guid(text):
+        out = GUID()
+        ole32.CLSIDFromString(text, ctypes.byref(out))
+        return out
+
+    clsid_shell_link = guid("{00021401-0000-0000-C000-000000000046}")
+    iid_shell_link_w = guid("{000214F9-0000-0000-C000-000000000046}")
+    iid_persist_file = guid("{0000010B-0000-0000-C000-000000000046}")
+
+    def com_call(obj, index, argtypes, *args):
+        """Invoke the method at vtable slot `index` on a raw COM pointer."""
+        vtable = ctypes.cast(
+            obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))
+        ).contents
+        proto = ctypes.WINFUNCTYPE(ctypes.HRESULT, ctypes.c_void_p, *argtypes)
+        return proto(vtable[index])(obj, *args)
+
+    ole32.CoInitialize(None)
+    try:
+        link = ctypes.c_void_p()
+        ole32.CoCreateInstance(
+            ctypes.byref(clsid_shell_link), None, 1,  # CLSCTX_INPROC_SERVER
+            ctypes.byref(iid_shell_link_w), ctypes.byref(link)
+        )
+        try:
+            # IShellLinkW vtable: SetPath=20, SetWorkingDirectory=9,
+            # SetDescription=7, SetIconLocation=17
+            com_call(link, 20, [ctypes.c_wchar_p], target)
+            com_call(link, 9, [ctypes.c_wchar_p], working_dir)
+            com_call(link, 7, [ctypes.c_wchar_p], description)
+            if icon:
+                com_call(link, 17, [ctypes.c_wchar_p, ctypes.c_int], icon, 0)
+
+            persist = ctypes.c_void_p()
+            com_call(
+                link, 0,  # QueryInterface
+                [ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)],
+                ctypes.byref(iid_persist_file), ctypes.byref(persist)
+            )
+            try:
+                # IPersistFile vtable: Save=6
+                com_call(
+                    persist, 6, [ctypes.c_wchar_p, ctypes.c_int],
+                    shortcut_path, 1
+                )
+            finally:
+                com_call(persist, 2, [])  # Release
+        finally:
+            com_call(link, 2, [])  # Release
+    finally:
+        ole32.CoUninitialize()
+
 
 def create_windows_shortcut():
     """Create a Windows desktop shortcut"""
@@ -16,10 +96,11 @@ def create_windows_shortcut():
         return False
 
     try:
-        # Method 1: Try using pywin32 (if available)
+        # Method 1: Try using pywin32 (if available). Imported lazily
+        # since pulling in win32com drags a pile of submodules along
         try:
-            import win32com.client
-            shell = win32com.client.Dispatch("WScript.Shell")
+            win32com_client = importlib.import_module("win32com.client")
+            shell = win32com_client.Dispatch("WScript.Shell")
 
             # Get desktop path
             desktop = shell.SpecialFolders("Desktop")
@@ -27,12 +108,12 @@ def create_windows_shortcut():
 
             # Create shortcut
             shortcut = shell.CreateShortCut(shortcut_path)
-            shortcut.TargetPath = str(Path(__file__).parent.parent / "launcher.bat")
-            shortcut.WorkingDirectory = str(Path(__file__).parent.parent)
+            shortcut.TargetPath = str(_APP_DIR / "launcher.bat")
+            shortcut.WorkingDirectory = str(_APP_DIR)
             shortcut.Description = "UnifyLLM Multi-Agent Debate System"
 
             # Try to set icon if available
-            icon_path = Path(__file__).parent / "icon.ico"
+            icon_path = _HERE / "icon.ico"
             if icon_path.exists():
                 shortcut.IconLocation = str(icon_path)
 
@@ -41,10 +122,8 @@ def create_windows_shortcut():
             return True
 
         except ImportError:
-            # Method 2: Fallback to VBScript method (no dependencies)
-            import tempfile
-            import subprocess
-
+            # Method 2: Drive IShellLink directly through ctypes -- no
+            # dependencies and no external process
             # Get desktop path from environment
             desktop = os.path.join(os.environ.get('USERPROFILE', ''), 'Desktop')
             if not os.path.exists(desktop):
@@ -53,41 +132,22 @@ def create_windows_shortcut():
                                       'Desktop')
 
             shortcut_path = os.path.join(desktop, "UnifyLLM.lnk")
-            launcher_path = str(Path(__file__).parent.parent / "launcher.bat").replace('/', '\\')
-            working_dir = str(Path(__file__).parent.parent).replace('/', '\\')
+            launcher_path = _LAUNCHER_BAT_STR
+            working_dir = _WORKING_DIR_STR
 
             # Get icon path if available
-            icon_path = Path(__file__).parent / "icon.ico"
-            icon_location = str(icon_path).replace('/', '\\') if icon_path.exists() else launcher_path
-
-            # Create VBScript to make shortcut
-            vbs_script = f'''
-Set oWS = WScript.CreateObject("WScript.Shell")
-Set oLink = oWS.CreateShortcut("{shortcut_path}")
-oLink.TargetPath = "{launcher_path}"
-oLink.WorkingDirectory = "{working_dir}"
-oLink.Description = "UnifyLLM Multi-Agent Debate System"
-oLink.IconLocation = "{icon_location}"
-oLink.Save
-'''
-
-            # Write VBScript to temp file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.vbs', delete=False) as f:
-                f.write(vbs_script)
-                vbs_path = f.name
-
-            try:
-                # Execute VBScript
-                subprocess.run(['cscript', '//Nologo', vbs_path], check=True,
-                             capture_output=True, text=True)
-                print(f"✓ Desktop shortcut created at: {shortcut_path}")
-                return True
-            finally:
-                # Clean up VBScript file
-                try:
-                    os.unlink(vbs_path)
-                except:
-                    pass
+            icon_path = _HERE / "icon.ico"
+            icon_location = str(icon_path).replace('/', '\\') if icon_path.exists() else None
+
+            _create_shortcut_com(
+                shortcut_path,
+                launcher_path,
+                working_dir,
+                "UnifyLLM Multi-Agent Debate System",
+                icon_location
+            )
+            print(f"✓ Desktop shortcut created at: {shortcut_path}")
+            return True
 
     except Exception as e:
         print(f"Warning: Could not create desktop shortcut: {e}")